@@ -1,5 +1,10 @@
 from .constants import Role
 from .gradescope import Gradescope
+from .transport import Transport, RequestsTransport, HTTPXTransport
+from .profiling import Profiler
 from .dataclass import Course, Assignment, StudentAssignment, Member, Submission
-from .errors import LoginError, NotLoggedInError, ResponseError
-from .utils import load_json, save_json, load_csv, save_csv, EnhancedJSONEncoder
+from .export import export_course
+from .diff import GradeChanges, GradeTracker, diff_grades
+from .snapshot import Snapshot, save_snapshot, load_snapshot
+from .errors import LoginError, NotLoggedInError, NotBoundError, ResponseError
+from .utils import load_json, save_json, load_csv, save_csv, assignments_to_dataframe, to_utc, past_submissions_urls, EnhancedJSONEncoder
@@ -0,0 +1,228 @@
+# analytics.py
+
+import numpy as np
+import pandas as pd
+from datetime import tzinfo
+from concurrent.futures import ThreadPoolExecutor
+from .constants import STUDENT_ROLE
+from .dataclass import Course, Assignment, Member, Submission
+from .gradescope import Gradescope
+from .utils import assignments_to_dataframe
+
+
+HOUR = pd.Timedelta(hours=1)
+
+
+def submissions_to_dataframe(submissions: list[Submission]) -> pd.DataFrame:
+    '''
+    Convert a list of submissions into a typed DataFrame.
+
+    `created_at` is parsed in one vectorized step into a timezone-aware (UTC) datetime and
+    `score` into a float.
+
+    Args:
+        submissions: The submissions to convert.
+
+    Returns:
+        The submissions as a pandas DataFrame with one row per submission.
+    '''
+    return pd.DataFrame({
+        'course_id': pd.array([s.course_id for s in submissions], dtype='Int64'),
+        'assignment_id': pd.array([s.assignment_id for s in submissions], dtype='Int64'),
+        'member_id': pd.array([None if s.member_id is None else str(s.member_id) for s in submissions], dtype='string'),
+        'submission_id': pd.array([s.submission_id for s in submissions], dtype='Int64'),
+        'created_at': pd.to_datetime([s.created_at for s in submissions], utc=True, errors='coerce', format='ISO8601'),
+        'score': pd.array([s.score for s in submissions], dtype='float64'),
+        'url': pd.array([s.url for s in submissions], dtype='string'),
+    })
+
+
+def collect_submissions(
+    gs: Gradescope,
+    course: Course,
+    assignments: list[Assignment] | None = None,
+    members: list[Member] | None = None,
+    max_workers: int = 8,
+) -> pd.DataFrame:
+    '''
+    Collect the past submissions of a course (or some of its assignments) into one typed table.
+
+    Each student's history is fetched with `Gradescope.get_member_submissions`, with students
+    processed concurrently.
+
+    Args:
+        gs: A logged in client.
+        course: The course.
+        assignments: The assignments to include (default is every assignment).
+        members: The members to include (default is every student of the course).
+        max_workers: The maximum number of concurrent requests (default is 8).
+
+    Returns:
+        The submissions as a DataFrame (see `submissions_to_dataframe`).
+    '''
+    if members is None:
+        members = [m for m in gs.get_members(course) if m.role == STUDENT_ROLE]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda m: gs.get_member_submissions(course, m, assignments), members)
+        submissions = [s for result in results for s in result]
+    return submissions_to_dataframe(submissions)
+
+
+def add_lateness(
+    submissions: pd.DataFrame,
+    assignments: list[Assignment] | pd.DataFrame,
+    tz: str | tzinfo | None = None,
+) -> pd.DataFrame:
+    '''
+    Add deadline columns to a submissions table.
+
+    Added columns: `due_date`, `hard_due_date`, `hours_to_deadline` (negative when late),
+    `late` (after the due date) and `after_hard_deadline` (after the hard due date).
+
+    Gradescope gives deadlines in the time zone of the course, so pass that zone as `tz` when it
+    is not the local time zone. Submission times carry their own offset.
+
+    Args:
+        submissions: The submissions table.
+        assignments: The assignments, as a list or as returned by `assignments_to_dataframe`.
+        tz: The time zone of the course, used when `assignments` is a list (default is the local time zone).
+
+    Returns:
+        A new DataFrame with the lateness columns.
+    '''
+    if not isinstance(assignments, pd.DataFrame):
+        assignments = assignments_to_dataframe(assignments, tz)
+    deadlines = assignments[['assignment_id', 'due_date', 'hard_due_date']].drop_duplicates('assignment_id')
+
+    df = submissions.drop(columns=['due_date', 'hard_due_date'], errors='ignore').merge(
+        deadlines, on='assignment_id', how='left'
+    )
+    df['hours_to_deadline'] = (df['due_date'] - df['created_at']) / HOUR
+    df['late'] = (df['created_at'] > df['due_date']).astype('boolean').mask(df['due_date'].isna())
+    df['after_hard_deadline'] = (df['created_at'] > df['hard_due_date']).astype('boolean').mask(df['hard_due_date'].isna())
+    return df
+
+
+def score_progression(submissions: pd.DataFrame) -> pd.DataFrame:
+    '''
+    Summarize how each student's score evolved on each assignment.
+
+    Args:
+        submissions: The submissions table.
+
+    Returns:
+        One row per (assignment_id, member_id) with `attempts`, `first_score`, `final_score`,
+        `best_score`, `improvement` (final - first), `first_submission` and `last_submission`.
+        The first and final scores are those of the first and last submission, so they are NaN
+        when that submission is ungraded.
+    '''
+    keys = ['assignment_id', 'member_id']
+    ordered = submissions.sort_values('created_at', kind='stable')
+    groups = ordered.groupby(keys, sort=False)
+    df = groups.agg(
+        attempts=('submission_id', 'size'),
+        best_score=('score', 'max'),
+        first_submission=('created_at', 'min'),
+        last_submission=('created_at', 'max'),
+    )
+    # head/tail keep the actual first and last rows; 'first'/'last' aggregations would skip NaN scores
+    df.insert(1, 'first_score', groups.head(1).set_index(keys)['score'])
+    df.insert(2, 'final_score', groups.tail(1).set_index(keys)['score'])
+    df.insert(4, 'improvement', df['final_score'] - df['first_score'])
+    return df.sort_index()
+
+
+def student_summary(submissions: pd.DataFrame) -> pd.DataFrame:
+    '''
+    Aggregate submission activity per student.
+
+    If the table has lateness columns (see `add_lateness`) the number of late submissions and
+    the median hours to deadline are included.
+
+    Args:
+        submissions: The submissions table.
+
+    Returns:
+        One row per member_id.
+    '''
+    aggregations = {
+        'submissions': ('submission_id', 'size'),
+        'assignments': ('assignment_id', 'nunique'),
+        'first_submission': ('created_at', 'min'),
+        'last_submission': ('created_at', 'max'),
+    }
+    if 'late' in submissions.columns:
+        aggregations['late_submissions'] = ('late', 'sum')
+        aggregations['median_hours_to_deadline'] = ('hours_to_deadline', 'median')
+    df = submissions.groupby('member_id').agg(**aggregations)
+    df['resubmissions'] = df['submissions'] - df['assignments']
+
+    progression = score_progression(submissions).groupby('member_id')
+    df['mean_final_score'] = progression['final_score'].mean()
+    df['mean_improvement'] = progression['improvement'].mean()
+    return df
+
+
+def assignment_summary(submissions: pd.DataFrame) -> pd.DataFrame:
+    '''
+    Aggregate submission activity per assignment.
+
+    If the table has lateness columns (see `add_lateness`) the share of late students, the number
+    of submissions after the hard deadline and the median hours to deadline are included.
+
+    Args:
+        submissions: The submissions table.
+
+    Returns:
+        One row per assignment_id.
+    '''
+    df = submissions.groupby('assignment_id').agg(
+        submissions=('submission_id', 'size'),
+        students=('member_id', 'nunique'),
+    )
+    progression = score_progression(submissions).groupby('assignment_id')
+    df['mean_attempts'] = progression['attempts'].mean()
+    df['max_attempts'] = progression['attempts'].max()
+    df['mean_final_score'] = progression['final_score'].mean()
+    df['median_final_score'] = progression['final_score'].median()
+
+    if 'late' in submissions.columns:
+        groups = submissions.groupby('assignment_id')
+        keys = ['assignment_id', 'member_id']
+        last = submissions.sort_values('created_at', kind='stable').groupby(keys, sort=False).tail(1)
+        df['late_students'] = last.groupby('assignment_id')['late'].mean()
+        df['after_hard_deadline'] = groups['after_hard_deadline'].sum()
+        df['median_hours_to_deadline'] = groups['hours_to_deadline'].median()
+    return df
+
+
+def submission_histogram(
+    submissions: pd.DataFrame,
+    freq: str = '1h',
+    relative_to_deadline: bool = False,
+    by: str | None = None,
+) -> pd.DataFrame | pd.Series:
+    '''
+    Count submissions per time bin.
+
+    Args:
+        submissions: The submissions table.
+        freq: The bin width as a pandas frequency string (default is '1h').
+        relative_to_deadline: If True, bin by time before the due date instead of by wall-clock time.
+            Requires lateness columns (see `add_lateness`). Bins are labelled with hours to the
+            deadline; negative values are late (default is False).
+        by: A column to split the counts by, e.g. 'assignment_id' (default is None).
+
+    Returns:
+        A Series of counts per bin, or a DataFrame with one column per `by` value.
+    '''
+    if relative_to_deadline:
+        width = pd.Timedelta(freq) / HOUR
+        bins = np.floor(submissions['hours_to_deadline'].to_numpy(dtype='float64', na_value=np.nan) / width) * width
+        keys = pd.Series(bins, index=submissions.index, name='hours_to_deadline')
+    else:
+        keys = submissions['created_at'].dt.floor(freq)
+
+    if by is None:
+        return submissions.groupby(keys).size().sort_index()
+    return submissions.groupby([keys, submissions[by]]).size().unstack(by, fill_value=0).sort_index()
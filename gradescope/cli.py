@@ -0,0 +1,95 @@
+# cli.py
+
+import os
+import sys
+import getpass
+import argparse
+from .constants import Role
+from .dataclass import Course
+from .errors import GradescopeError
+from .export import export_course
+from .gradescope import Gradescope
+from .transport import RequestsTransport, HTTPXTransport
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='gradescope', description='Command-line tools for Gradescope.')
+    parser.add_argument('-u', '--username', help='Gradescope username (default: $GRADESCOPE_USERNAME)')
+    parser.add_argument('-p', '--password', help='Gradescope password (default: $GRADESCOPE_PASSWORD or prompt)')
+    parser.add_argument('-v', '--verbose', action='store_true', help='enable verbose logging')
+    parser.add_argument('--http2', action='store_true', help='use the HTTP/2 transport (requires gradescope-tool[http2])')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export = commands.add_parser('export', help='export a course to a directory')
+    export.add_argument('course_id', type=int, help='the course ID')
+    export.add_argument('-o', '--output', help='output directory (default: ./course-<course_id>)')
+    export.add_argument('--files', action='store_true', help="also download every student's latest submission file")
+    export.add_argument('--fetch-workers', type=int, default=8, help='number of fetch threads (default: 8)')
+    export.add_argument('--parse-workers', type=int, default=2, help='number of parse threads (default: 2)')
+    export.add_argument('--queue-size', type=int, default=64, help='capacity of the parse and write queues (default: 64)')
+    return parser
+
+
+def _find_course(gs: Gradescope, course_id: int) -> Course:
+    '''Returns the instructor course with the given ID, or a minimal Course if it is not listed.'''
+    course = gs.get_courses(Role.INSTRUCTOR, as_dict=True).get(course_id)
+    if course is None:
+        course = Course(course_id, f'/courses/{course_id}', Role.INSTRUCTOR, '', '', '')._bind(gs)
+    return course
+
+
+def _export(gs: Gradescope, args: argparse.Namespace) -> int:
+    course = _find_course(gs, args.course_id)
+    output = args.output or f'course-{args.course_id}'
+    print(f'Exporting {course.short_name or course.course_id} to {output} ...')
+    stats = export_course(
+        gs,
+        course,
+        output,
+        files=args.files,
+        fetch_workers=args.fetch_workers,
+        parse_workers=args.parse_workers,
+        queue_size=args.queue_size,
+    )
+    print(stats.report())
+    if stats.errors:
+        print(f'Export finished with {stats.errors} errors, see the log above.', file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    '''Entry point of the `gradescope` command. Returns 1 if login, a request or any export item failed.'''
+    args = _build_parser().parse_args(argv)
+
+    username = args.username or os.environ.get('GRADESCOPE_USERNAME')
+    password = args.password or os.environ.get('GRADESCOPE_PASSWORD')
+    if username is None:
+        username = input('Username: ')
+    if password is None:
+        password = getpass.getpass('Password: ')
+
+    fetch_workers = getattr(args, 'fetch_workers', 8)
+    try:
+        if args.http2:
+            transport = HTTPXTransport(max_connections=fetch_workers, max_keepalive_connections=fetch_workers)
+        else:
+            transport = RequestsTransport(pool_maxsize=fetch_workers)
+    except ImportError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    try:
+        gs = Gradescope(username, password, verbose=args.verbose, transport=transport)
+        if not gs.logged_in:
+            print('Login failed, please check username and password.', file=sys.stderr)
+            return 1
+        if args.command == 'export':
+            return _export(gs, args)
+    except (GradescopeError, *transport.exceptions) as e:
+        # Connection errors and timeouts (e.g. during login) get a message instead of a traceback
+        print(e, file=sys.stderr)
+        return 1
+    finally:
+        transport.close()
+    return 0
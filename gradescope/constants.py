@@ -5,6 +5,7 @@ BASE_URL = 'https://www.gradescope.com'
 LOGIN_URL = f'{BASE_URL}/login'
 GRADEBOOK = 'https://www.gradescope.com/courses/{course_id}/gradebook.json?user_id={member_id}'
 PAST_SUBMISSIONS = '.json?content=react&only_keys%5B%5D=past_submissions'
+STUDENT_ROLE = '0'  # Member.role of students on the roster page
 
 
 ROLE_MAP = {
@@ -1,12 +1,70 @@
 # dataclass.py
 
+from __future__ import annotations
+
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable
 from urllib.parse import urljoin
 from .constants import BASE_URL, Role
+from .errors import NotBoundError
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from .gradescope import Gradescope
+
+
+class _Related:
+    '''
+    Mixin that lets a model lazily load related data through the Gradescope client it was created by.
+
+    The client and parent objects are stored as plain attributes rather than dataclass fields, so they
+    are left out of repr, equality and `dataclasses.asdict`. Loaded data is cached per object until
+    `invalidate` is called.
+
+    Pickling and copying keep only the dataclass fields: the client (with its credentials and session),
+    the parents and the cache are dropped, so the copy is unbound.
+    '''
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {name: value for name, value in self.__dict__.items() if not name.startswith('_')}
+
+    def _bind(self, client: Gradescope, **parents: Any):
+        '''Attaches the client (and optional parent objects) used to load related data.'''
+        self._client = client
+        for name, parent in parents.items():
+            setattr(self, f'_{name}', parent)
+        return self
+
+    def _related(self, name: str, loader: Callable[[Gradescope], Any]) -> Any:
+        '''Returns the cached value for `name`, loading it with `loader(client)` on first access.'''
+        cache = self.__dict__.setdefault('_cache', {})
+        if name not in cache:
+            client = getattr(self, '_client', None)
+            if client is None:
+                raise NotBoundError
+            cache[name] = loader(client)
+        return cache[name]
+
+    def is_loaded(self, name: str) -> bool:
+        '''Returns True if the related data `name` is already cached.'''
+        return name in self.__dict__.get('_cache', {})
+
+    def invalidate(self, *names: str) -> None:
+        '''
+        Drops cached related data so it is reloaded on next access.
+
+        Args:
+            *names (str): The names to drop (e.g. 'assignments'). Drops everything if none are given.
+        '''
+        cache = self.__dict__.get('_cache', {})
+        if not names:
+            cache.clear()
+        for name in names:
+            cache.pop(name, None)
 
 
 @dataclass
-class Course:
+class Course(_Related):
     '''Represents a course in Gradescope.'''
     course_id: int
     url: str
@@ -19,9 +77,31 @@ class Course:
         '''Returns the full URL of the course.'''
         return urljoin(BASE_URL, self.url)
 
+    @property
+    def assignments(self) -> list[Assignment]:
+        '''The assignments of the course, loaded on first access.'''
+        return self._related('assignments', lambda gs: gs.get_assignments(self))
+
+    @property
+    def student_assignments(self) -> list[StudentAssignment]:
+        '''The assignments of the course as seen by a student, loaded on first access.'''
+        return self._related('student_assignments', lambda gs: gs.get_assignments_as_student(self))
+
+    @property
+    def members(self) -> list[Member]:
+        '''The members of the course, loaded on first access.'''
+        return self._related('members', lambda gs: gs.get_members(self))
+
+    def prefetch(self, grades: bool = False, max_workers: int = 8) -> Course:
+        '''Loads the assignments and members (and optionally grades) of the course concurrently.'''
+        client = getattr(self, '_client', None)
+        if client is None:
+            raise NotBoundError
+        return client.prefetch(self, grades=grades, max_workers=max_workers)
+
 
 @dataclass
-class Assignment:
+class Assignment(_Related):
     '''Represents an assignment in Gradescope.'''
     assignment_id: int
     assignment_type: str
@@ -60,6 +140,16 @@ class Assignment:
         '''Returns the URL to download the grades for the assignment.'''
         return urljoin(BASE_URL, self.url + '/scores.csv')
 
+    @property
+    def course(self) -> Course | None:
+        '''The course the assignment was loaded from, if known.'''
+        return getattr(self, '_course', None)
+
+    @property
+    def grades(self) -> pd.DataFrame:
+        '''The grades of the assignment, loaded on first access.'''
+        return self._related('grades', lambda gs: gs.get_assignment_grades(self))
+
 
 @dataclass
 class StudentAssignment:
@@ -75,7 +165,7 @@ class StudentAssignment:
 
 
 @dataclass
-class Member:
+class Member(_Related):
     '''Represents a member (student or instructor) in Gradescope.'''
     member_id: int
     full_name: str
@@ -85,6 +175,18 @@ class Member:
     sid: str
     email: str
 
+    @property
+    def course(self) -> Course | None:
+        '''The course the member was loaded from, if known.'''
+        return getattr(self, '_course', None)
+
+    @property
+    def gradebook(self) -> dict:
+        '''The gradebook of the member in their course, loaded on first access.'''
+        if self.course is None:
+            raise NotBoundError('Member is not bound to a course.')
+        return self._related('gradebook', lambda gs: gs.get_gradebook(self.course, self))
+
 
 @dataclass
 class Submission:
@@ -0,0 +1,198 @@
+# diff.py
+
+import numpy as np
+import pandas as pd
+import logging as log
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from .dataclass import Assignment
+
+if TYPE_CHECKING:
+    from .gradescope import Gradescope
+
+
+DEFAULT_KEYS = ['SID', 'Email']
+FALLBACK_KEY = 'SID or Email'
+# scores.csv columns that change when a student views or resubmits their work, not when their grade changes
+ACTIVITY_COLUMNS = ['Submission ID', 'Submission Time', 'Lateness (H:M:S)', 'View Count', 'Submission Count']
+
+
+@dataclass
+class GradeChanges:
+    '''Represents the changes between two scores.csv snapshots of an assignment.'''
+    key: str
+    added: pd.DataFrame
+    removed: pd.DataFrame
+    changed: pd.DataFrame
+    updated: pd.DataFrame = field(repr=False)
+
+    # added / removed: full rows indexed by key
+    # changed: one row per changed cell with columns [key, 'column', 'old', 'new']
+    # updated: the new rows (indexed by key) of every added or changed student
+
+    @property
+    def is_empty(self) -> bool:
+        '''Returns True if nothing changed.'''
+        return self.added.empty and self.removed.empty and self.changed.empty
+
+
+def _resolve_key(frames: list[pd.DataFrame], key: str | None) -> str:
+    '''Returns the first default key column without missing values, or FALLBACK_KEY if SID has gaps.'''
+    if key is not None:
+        return key
+    present = [c for c in DEFAULT_KEYS if all(c in frame.columns for frame in frames)]
+    if not present:
+        raise KeyError(f'None of the key columns {DEFAULT_KEYS} found in grades.')
+    if present == DEFAULT_KEYS and any(frame['SID'].isna().any() for frame in frames):
+        return FALLBACK_KEY
+    return present[0]
+
+
+def _as_text(values: pd.Series) -> pd.Series:
+    '''Converts key values to strings, writing whole floats (SIDs read next to blanks) as integers.'''
+    if pd.api.types.is_float_dtype(values) and (values.dropna() % 1 == 0).all():
+        values = values.astype('Int64')
+    return values.astype('string')
+
+
+def _index_by(grades: pd.DataFrame, key: str) -> pd.DataFrame:
+    '''
+    Indexes the grades by key, dropping duplicated keys (keeping the last).
+
+    With FALLBACK_KEY each row is keyed by its SID, or by its Email if the SID is blank.
+    '''
+    if key == FALLBACK_KEY:
+        keys = _as_text(grades['SID']).fillna(grades['Email'].astype('string'))
+    else:
+        keys = grades[key]
+    missing = keys.isna()
+    if missing.any():
+        raise ValueError(
+            f'{missing.sum()} rows have no {key}, so their changes cannot be tracked. '
+            f'Pass a key column without missing values.'
+        )
+
+    indexed = grades.set_index(pd.Index(keys, name=key))
+    duplicated = indexed.index.duplicated(keep='last')
+    if duplicated.any():
+        log.warning(f'[GradeDiff] Dropping {duplicated.sum()} rows with duplicated {key}.')
+        indexed = indexed[~duplicated]
+    return indexed
+
+
+def diff_grades(
+    old: pd.DataFrame | None,
+    new: pd.DataFrame,
+    key: str | None = None,
+    columns: list[str] | None = None,
+) -> GradeChanges:
+    '''
+    Computes the added, removed and changed students and scores between two grade DataFrames.
+
+    Args:
+        old (pd.DataFrame | None): The previous grades, or None if there are none yet.
+        new (pd.DataFrame): The current grades, as returned by `Gradescope.get_assignment_grades`.
+        key (str | None): The column identifying a student. Defaults to 'SID', or 'Email' if there is no
+            SID column. If some SIDs are blank, each row is keyed by its SID or, if blank, its Email
+            (reported as the key 'SID or Email').
+        columns (list[str] | None): The columns to compare. Defaults to every column present in both
+            DataFrames except ACTIVITY_COLUMNS (view and submission counts, submission time and ID,
+            lateness); pass them explicitly to compare them too.
+
+    Returns:
+        GradeChanges: The change set.
+
+    Raises:
+        KeyError: If no key is given and neither default key column exists.
+        ValueError: If some rows have no value for the key.
+    '''
+    key = _resolve_key([new] if old is None else [old, new], key)
+    new = _index_by(new, key)
+    old = _index_by(old, key) if old is not None else new.iloc[0:0]
+
+    # Align both snapshots with one hash join on the key instead of repeated lookups
+    old_positions = old.index.get_indexer(new.index)
+    in_old = old_positions >= 0
+    added = new[~in_old]
+    removed = old[new.index.get_indexer(old.index) < 0]
+
+    if columns is None:
+        columns = [c for c in new.columns if c in old.columns and c not in ACTIVITY_COLUMNS]
+    common = new.index[in_old]
+    before = old[columns].iloc[old_positions[in_old]].to_numpy(dtype=object)
+    after = new[columns][in_old].to_numpy(dtype=object)
+
+    differs = (before != after) & ~(pd.isna(before) & pd.isna(after))
+    rows, cols = np.nonzero(differs)
+    changed = pd.DataFrame({
+        key: common[rows],
+        'column': np.asarray(columns, dtype=object)[cols],
+        'old': before[rows, cols],
+        'new': after[rows, cols],
+    })
+
+    updated = pd.concat([added, new[in_old][differs.any(axis=1)]])
+    return GradeChanges(key=key, added=added, removed=removed, changed=changed, updated=updated)
+
+
+class GradeTracker:
+    '''
+    Keeps the last scores snapshot per assignment and reports what changed on each update.
+    '''
+
+    def __init__(
+        self,
+        client: 'Gradescope | None' = None,
+        key: str | None = None,
+        columns: list[str] | None = None,
+    ) -> None:
+        '''
+        Initializes a GradeTracker object.
+
+        Args:
+            client (Gradescope | None): The client used to fetch grades when `update` is not given any. Defaults to None.
+            key (str | None): The column identifying a student. See `diff_grades`. Defaults to None.
+            columns (list[str] | None): The columns to compare. See `diff_grades`. Defaults to None.
+        '''
+        self.client = client
+        self.key = key
+        self.columns = columns
+        self.snapshots: dict[int, pd.DataFrame] = dict()
+
+    def update(self, assignment: Assignment, grades: pd.DataFrame | None = None) -> GradeChanges:
+        '''
+        Diffs the current grades of an assignment against the last snapshot and stores them as the new snapshot.
+
+        On the first update of an assignment every student is reported as added.
+
+        Args:
+            assignment (Assignment): The assignment.
+            grades (pd.DataFrame | None): The current grades. Fetched through the client if None. Defaults to None.
+
+        Returns:
+            GradeChanges: The changes since the last update.
+
+        Raises:
+            TypeError: If `grades` is None and the tracker has no client.
+        '''
+        if grades is None:
+            if self.client is None:
+                raise TypeError('Either grades or a client must be given.')
+            grades = self.client.get_assignment_grades(assignment)
+
+        changes = diff_grades(self.snapshots.get(assignment.assignment_id), grades, self.key, self.columns)
+        # Copy so that later in-place changes to the caller's DataFrame do not move the baseline
+        self.snapshots[assignment.assignment_id] = grades.copy()
+        return changes
+
+    def reset(self, assignment: Assignment | None = None) -> None:
+        '''
+        Forgets the snapshot of an assignment, or of every assignment if none is given.
+
+        Args:
+            assignment (Assignment | None): The assignment to forget. Defaults to None.
+        '''
+        if assignment is None:
+            self.snapshots.clear()
+        else:
+            self.snapshots.pop(assignment.assignment_id, None)
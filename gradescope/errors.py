@@ -21,3 +21,8 @@ class NotLoggedInError(GradescopeError):
 class ResponseError(GradescopeError):
     def __init__(self, msg: str):
         super().__init__(msg)
+
+
+class NotBoundError(GradescopeError):
+    def __init__(self, msg: str = 'Object is not bound to a Gradescope client.'):
+        super().__init__(msg)
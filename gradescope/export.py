@@ -0,0 +1,403 @@
+# export.py
+
+import os
+import json
+import time
+import queue
+import threading
+import pandas as pd
+import logging as log
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+from .constants import GRADEBOOK, STUDENT_ROLE
+from .dataclass import Course
+from .diff import DEFAULT_KEYS, FALLBACK_KEY, _index_by
+from .gradescope import Gradescope
+from .utils import save_json, save_csv, past_submissions_urls, EnhancedJSONEncoder
+
+
+@dataclass
+class Job:
+    '''A request to be fetched by the pipeline.'''
+    kind: str
+    url: str
+    endpoint: str = 'page'
+    context: dict = field(default_factory=dict)
+
+
+@dataclass
+class Record:
+    '''A parsed result to be written by the pipeline.'''
+    kind: str
+    data: Any
+    context: dict = field(default_factory=dict)
+
+
+@dataclass
+class StageStats:
+    '''Represents the counters of one pipeline stage.'''
+    name: str
+    workers: int
+    items: int = 0
+    errors: int = 0
+    busy: float = 0.0
+    bytes: int = 0
+
+    def throughput(self, elapsed: float) -> float:
+        '''Returns the number of items handled per second of wall time.'''
+        return self.items / elapsed if elapsed > 0 else 0.0
+
+
+@dataclass
+class PipelineStats:
+    '''Represents the per-stage counters, the failures per job kind and the wall time of a pipeline run.'''
+    stages: list[StageStats]
+    elapsed: float = 0.0
+    failed: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def errors(self) -> int:
+        '''The number of failed items across all stages.'''
+        return sum(stage.errors for stage in self.stages)
+
+    def report(self) -> str:
+        '''Returns the stats formatted as a table.'''
+        lines = [f'{"stage":<8}{"workers":>8}{"items":>8}{"errors":>8}{"busy (s)":>10}{"items/s":>10}{"MB":>9}']
+        for stage in self.stages:
+            lines.append(
+                f'{stage.name:<8}{stage.workers:>8}{stage.items:>8}{stage.errors:>8}'
+                f'{stage.busy:>10.2f}{stage.throughput(self.elapsed):>10.1f}{stage.bytes / 1e6:>9.2f}'
+            )
+        lines.append(f'Total wall time: {self.elapsed:.2f}s')
+        if self.failed:
+            lines.append('Failed: ' + ', '.join(f'{kind} ({count})' for kind, count in sorted(self.failed.items())))
+        return '\n'.join(lines)
+
+
+class Pipeline:
+    '''
+    A fetch -> parse -> write pipeline connected by bounded queues.
+
+    Fetch workers download `Job`s and hand the responses to parse workers. Parsing a response may
+    produce new `Job`s (fed back to the fetch stage) and `Record`s (passed to the single writer).
+    The parse and write queues are bounded so memory stays flat when one stage is slower than the
+    others; the fetch queue only holds small `Job`s and is unbounded so feedback never deadlocks.
+    '''
+
+    def __init__(
+        self,
+        fetch: Callable[[Job], Any],
+        parse: Callable[[Job, Any], Iterable[Job | Record]],
+        write: Callable[[Record], None],
+        fetch_workers: int = 8,
+        parse_workers: int = 2,
+        queue_size: int = 64,
+    ) -> None:
+        '''
+        Initializes a Pipeline object.
+
+        Args:
+            fetch (Callable[[Job], Any]): Downloads a job and returns its response.
+            parse (Callable[[Job, Any], Iterable[Job | Record]]): Turns a response into new jobs and records.
+            write (Callable[[Record], None]): Persists a record.
+            fetch_workers (int): The number of fetch threads. Defaults to 8.
+            parse_workers (int): The number of parse threads. Defaults to 2.
+            queue_size (int): The capacity of the parse and write queues. Defaults to 64.
+        '''
+        self._fetch = fetch
+        self._parse = parse
+        self._write = write
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers
+        self.fetch_queue: queue.Queue = queue.Queue()
+        self.parse_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.write_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.stats = PipelineStats([
+            StageStats('fetch', fetch_workers),
+            StageStats('parse', parse_workers),
+            StageStats('write', 1),
+        ])
+        self._lock = threading.Lock()
+
+    def _record(self, stage: StageStats, kind: str, started: float, ok: bool, size: int = 0) -> None:
+        with self._lock:
+            stage.busy += time.perf_counter() - started
+            stage.items += 1
+            stage.bytes += size
+            if not ok:
+                stage.errors += 1
+                self.stats.failed[kind] = self.stats.failed.get(kind, 0) + 1
+
+    def _fetch_worker(self) -> None:
+        stage = self.stats.stages[0]
+        while True:
+            job = self.fetch_queue.get()
+            if job is None:
+                self.fetch_queue.task_done()
+                return
+            started = time.perf_counter()
+            try:
+                response = self._fetch(job)
+            except Exception as e:
+                log.warning(f'[Export] Fetch failed for {job.kind} {job.url}: {e}')
+                self._record(stage, job.kind, started, False)
+            else:
+                self._record(stage, job.kind, started, True, len(getattr(response, 'content', b'')))
+                self.parse_queue.put((job, response))
+            self.fetch_queue.task_done()
+
+    def _parse_worker(self) -> None:
+        stage = self.stats.stages[1]
+        while True:
+            item = self.parse_queue.get()
+            if item is None:
+                self.parse_queue.task_done()
+                return
+            job, response = item
+            started = time.perf_counter()
+            try:
+                outputs = list(self._parse(job, response))
+            except Exception as e:
+                log.warning(f'[Export] Parse failed for {job.kind} {job.url}: {e}')
+                self._record(stage, job.kind, started, False)
+            else:
+                self._record(stage, job.kind, started, True)
+                for output in outputs:
+                    if isinstance(output, Job):
+                        self.fetch_queue.put(output)
+                    else:
+                        self.write_queue.put(output)
+            self.parse_queue.task_done()
+
+    def _write_worker(self) -> None:
+        stage = self.stats.stages[2]
+        while True:
+            record = self.write_queue.get()
+            if record is None:
+                self.write_queue.task_done()
+                return
+            started = time.perf_counter()
+            try:
+                self._write(record)
+            except Exception as e:
+                log.warning(f'[Export] Write failed for {record.kind}: {e}')
+                self._record(stage, record.kind, started, False)
+            else:
+                self._record(stage, record.kind, started, True)
+            self.write_queue.task_done()
+
+    def run(self, jobs: Iterable[Job]) -> PipelineStats:
+        '''
+        Runs the pipeline until every job, and every job produced while parsing, has been written.
+
+        Args:
+            jobs (Iterable[Job]): The initial jobs.
+
+        Returns:
+            PipelineStats: The per-stage counters of the run.
+        '''
+        started = time.perf_counter()
+        for job in jobs:
+            self.fetch_queue.put(job)
+
+        threads = (
+            [threading.Thread(target=self._fetch_worker, daemon=True) for _ in range(self.fetch_workers)]
+            + [threading.Thread(target=self._parse_worker, daemon=True) for _ in range(self.parse_workers)]
+            + [threading.Thread(target=self._write_worker, daemon=True)]
+        )
+        for thread in threads:
+            thread.start()
+
+        # Parsing can enqueue new fetch jobs, so drain both stages until no fetch work is left
+        while True:
+            self.fetch_queue.join()
+            self.parse_queue.join()
+            if self.fetch_queue.unfinished_tasks == 0:
+                break
+        self.write_queue.join()
+
+        for _ in range(self.fetch_workers):
+            self.fetch_queue.put(None)
+        for _ in range(self.parse_workers):
+            self.parse_queue.put(None)
+        self.write_queue.put(None)
+        for thread in threads:
+            thread.join()
+
+        self.stats.elapsed = time.perf_counter() - started
+        return self.stats
+
+
+class CourseExporter:
+    '''
+    Exports a course (assignments, roster, grades, submission history and optionally files) to a directory.
+
+    Output layout:
+        assignments.json, members.json, submissions.json
+        grades/<assignment_id>.csv and grade_matrix.csv (Total Score per student and assignment)
+        files/<assignment_id>/<member_id>/<submission_id>.zip (latest submission only, if `files` is True)
+    '''
+
+    def __init__(self, gs: Gradescope, course: Course, output: str, files: bool = False) -> None:
+        '''
+        Initializes a CourseExporter object.
+
+        Args:
+            gs (Gradescope): A logged in client.
+            course (Course): The course to export.
+            output (str): The output directory.
+            files (bool): Whether to download the latest submission file of every student. Defaults to False.
+        '''
+        self.gs = gs
+        self.course = course
+        self.output = output
+        self.files = files
+        self.assignments = []
+        self.members = []
+        self.submissions = []
+        self.totals: dict[int, pd.Series] = dict()
+
+    def initial_jobs(self) -> list[Job]:
+        '''Returns the jobs the export starts from.'''
+        return [
+            Job('assignments', self.course.get_url() + '/assignments'),
+            Job('members', self.course.get_url() + '/memberships'),
+        ]
+
+    def fetch(self, job: Job) -> Any:
+        '''Downloads a job through the client transport.'''
+        response = self.gs.transport.get(job.url, endpoint=job.endpoint)
+        self.gs._response_check(response)
+        return response
+
+    def parse(self, job: Job, response: Any) -> Iterable[Job | Record]:
+        '''Parses a response into records to write and follow-up jobs.'''
+        course_id = self.course.course_id
+        if job.kind == 'assignments':
+            assignments = self.gs._parse_assignments(response.text, self.course)
+            yield Record('assignments', assignments)
+            for assignment in assignments:
+                yield Job('grades', assignment.get_grades_url(), 'csv', {'assignment': assignment})
+
+        elif job.kind == 'members':
+            members = self.gs._parse_members(response.text, self.course)
+            yield Record('members', members)
+            for member in members:
+                if member.role == STUDENT_ROLE:
+                    url = GRADEBOOK.format(course_id=course_id, member_id=member.member_id)
+                    yield Job('gradebook', url, 'json', {'member': member})
+
+        elif job.kind == 'grades':
+            yield Record('grades', self.gs._parse_grades(response.content), job.context)
+
+        elif job.kind == 'gradebook':
+            member = job.context['member']
+            for assignment_id, url in past_submissions_urls(json.loads(response.text)).items():
+                yield Job('history', url, 'json', {'member': member, 'assignment_id': assignment_id})
+
+        elif job.kind == 'history':
+            member = job.context['member']
+            submissions = self.gs._parse_past_submissions(
+                response.text, course_id, job.context['assignment_id'], member.member_id
+            )
+            yield Record('submissions', submissions)
+            if self.files and submissions:
+                # Submission IDs increase over time; created_at strings carry varying UTC offsets
+                latest = max(submissions, key=lambda s: s.submission_id or 0)
+                path = os.path.join(
+                    self.output, 'files', str(latest.assignment_id), str(latest.member_id), f'{latest.submission_id}.zip'
+                )
+                yield Job('file', latest.get_file_url(), 'download', {'path': path})
+
+        elif job.kind == 'file':
+            yield Record('file', response.content, job.context)
+
+    def write(self, record: Record) -> None:
+        '''Writes a record, or collects it for `finish` when it belongs to a combined file.'''
+        if record.kind == 'assignments':
+            self.assignments.extend(record.data)
+        elif record.kind == 'members':
+            self.members.extend(record.data)
+        elif record.kind == 'submissions':
+            self.submissions.extend(record.data)
+        elif record.kind == 'grades':
+            assignment = record.context['assignment']
+            save_csv(os.path.join(self.output, 'grades', f'{assignment.assignment_id}.csv'), record.data)
+            grades = record.data
+            keys = [key for key in DEFAULT_KEYS if key in grades.columns]
+            if keys and 'Total Score' in grades.columns:
+                # Key every assignment the same way (SID, or Email when blank) so the matrix rows line up
+                key = FALLBACK_KEY if keys == DEFAULT_KEYS else keys[0]
+                self.totals[assignment.assignment_id] = _index_by(grades, key)['Total Score']
+        elif record.kind == 'file':
+            os.makedirs(os.path.dirname(record.context['path']), exist_ok=True)
+            with open(record.context['path'], 'wb') as file:
+                file.write(record.data)
+
+    def finish(self, stats: PipelineStats) -> None:
+        '''
+        Writes the combined files once the pipeline has drained.
+
+        The assignment and member lists are not written if they could not be fetched, so a failed
+        export does not leave behind files that look like an empty course.
+        '''
+        for name, data in (('assignments', self.assignments), ('members', self.members)):
+            if name in stats.failed:
+                log.warning(f'[Export] Not writing {name}.json because the {name} could not be exported.')
+            else:
+                save_json(os.path.join(self.output, f'{name}.json'), data, encoder=EnhancedJSONEncoder)
+        save_json(os.path.join(self.output, 'submissions.json'), self.submissions, encoder=EnhancedJSONEncoder)
+        if self.totals:
+            # One column per assignment, in the order of the assignments page
+            columns = {}
+            for assignment in self.assignments:
+                if assignment.assignment_id in self.totals:
+                    title = assignment.title if assignment.title not in columns else f'{assignment.title} ({assignment.assignment_id})'
+                    columns[title] = self.totals[assignment.assignment_id]
+            matrix = pd.concat(columns, axis=1)
+            save_csv(os.path.join(self.output, 'grade_matrix.csv'), matrix, index=True)
+
+    def run(self, fetch_workers: int = 8, parse_workers: int = 2, queue_size: int = 64) -> PipelineStats:
+        '''
+        Runs the export.
+
+        Args:
+            fetch_workers (int): The number of fetch threads. Defaults to 8.
+            parse_workers (int): The number of parse threads. Defaults to 2.
+            queue_size (int): The capacity of the parse and write queues. Defaults to 64.
+
+        Returns:
+            PipelineStats: The per-stage counters of the run. Check `errors` (or `failed`) for failed items.
+        '''
+        os.makedirs(os.path.join(self.output, 'grades'), exist_ok=True)
+        pipeline = Pipeline(self.fetch, self.parse, self.write, fetch_workers, parse_workers, queue_size)
+        stats = pipeline.run(self.initial_jobs())
+        self.finish(stats)
+        return stats
+
+
+def export_course(
+    gs: Gradescope,
+    course: Course,
+    output: str,
+    files: bool = False,
+    fetch_workers: int = 8,
+    parse_workers: int = 2,
+    queue_size: int = 64,
+) -> PipelineStats:
+    '''
+    Export a course to a directory. See `CourseExporter` for the output layout.
+
+    Args:
+        gs: A logged in client.
+        course: The course to export.
+        output: The output directory.
+        files: Whether to download the latest submission file of every student (default is False).
+        fetch_workers: The number of fetch threads (default is 8).
+        parse_workers: The number of parse threads (default is 2).
+        queue_size: The capacity of the parse and write queues (default is 64).
+
+    Returns:
+        The per-stage counters of the run. Failed items are logged and counted in `errors` and `failed`.
+    '''
+    return CourseExporter(gs, course, output, files).run(fetch_workers, parse_workers, queue_size)
@@ -6,13 +6,21 @@ import json
 import requests
 import pandas as pd
 import logging as log
-from bs4 import BeautifulSoup
-from datetime import datetime
-from urllib.parse import urljoin, urlparse, parse_qs
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup, SoupStrainer
+from datetime import datetime, tzinfo
+from urllib.parse import urlparse, parse_qs
 from typing import overload, Literal
 from .dataclass import Course, Assignment, StudentAssignment, Member, Submission
 from .errors import LoginError, NotLoggedInError, ResponseError
-from .constants import BASE_URL, LOGIN_URL, GRADEBOOK, PAST_SUBMISSIONS, ROLE_MAP, Role
+from .constants import BASE_URL, LOGIN_URL, GRADEBOOK, ROLE_MAP, Role
+from .utils import assignments_to_dataframe, past_submissions_urls
+from .transport import Transport, RequestsTransport
+from .profiling import Profiler
+
+
+_NO_PHASE = nullcontext()
 
 
 class Gradescope:
@@ -26,6 +34,8 @@ class Gradescope:
         password: str | None = None,
         auto_login: bool = True,
         verbose: bool = False,
+        transport: Transport | None = None,
+        profile: bool = False,
     ) -> None:
         '''
         Initializes a Gradescope object.
@@ -35,21 +45,76 @@ class Gradescope:
             password (str | None): The password for logging into Gradescope. Defaults to None.
             auto_login (bool): Whether to automatically login upon object initialization. Defaults to True.
             verbose (bool): Whether to enable verbose logging. Defaults to False.
+            transport (Transport | None): The HTTP backend to use, e.g. `HTTPXTransport()` for HTTP/2.
+                Defaults to a `RequestsTransport` with default timeouts and pool sizes.
+            profile (bool): Whether to enable profiling from the start (see `enable_profiling`). Defaults to False.
         '''
-        self.session = requests.session()
+        self.transport = transport if transport is not None else RequestsTransport()
+        self.session = self.transport.session
         self.username = username
         self.password = password
         self.verbose = verbose
         self.logged_in = False
+        self.profiler: Profiler | None = None
 
         if self.verbose:
             log.basicConfig(level=log.INFO)
         else:
             log.basicConfig(level=log.WARNING)
 
+        if profile:
+            self.enable_profiling()
+
         if auto_login and (not (username is None and password is None)):
             self.login()
 
+    def enable_profiling(self, trace_memory: bool = True) -> Profiler:
+        '''
+        Starts recording CPU time, wall time and memory of every public method call.
+
+        Each call is split into network (transport requests), parse (HTML/JSON/CSV parsing and tree walks)
+        and model (dataclass and DataFrame construction) phases, aggregated across calls in `self.profiler`.
+        Use `self.profiler.report()` for a table or `self.profiler.save_collapsed(path)` for flame graphs.
+
+        Args:
+            trace_memory (bool): Whether to record allocations and peak memory with tracemalloc.
+                This slows the run down noticeably. Defaults to True.
+
+        Returns:
+            Profiler: The profiler collecting the measurements.
+        '''
+        if self.profiler is not None:
+            self.disable_profiling()
+
+        self.profiler = Profiler(trace_memory)
+        self.profiler.start()
+        for name, attr in vars(Gradescope).items():
+            if callable(attr) and not name.startswith('_') and name not in ('enable_profiling', 'disable_profiling'):
+                setattr(self, name, self.profiler.wrap(f'Gradescope.{name}', getattr(self, name)))
+        self.transport.get = self.profiler.wrap('network', self.transport.get)
+        self.transport.post = self.profiler.wrap('network', self.transport.post)
+        return self.profiler
+
+    def disable_profiling(self) -> Profiler | None:
+        '''
+        Stops profiling and removes the method wrappers.
+
+        Returns:
+            Profiler | None: The profiler with the measurements so far, or None if profiling was not enabled.
+        '''
+        profiler = self.profiler
+        if profiler is None:
+            return None
+
+        for name in list(vars(self)):
+            if name in vars(Gradescope):
+                delattr(self, name)
+        for name in ('get', 'post'):
+            self.transport.__dict__.pop(name, None)
+        profiler.stop()
+        self.profiler = None
+        return profiler
+
     def login(self, username: str | None = None, password: str | None = None) -> bool:
         '''
         Log into Gradescope with the provided username and password.
@@ -72,10 +137,11 @@ class Gradescope:
         if self.username is None or self.password is None:
             raise TypeError('The username or password cannot be None.')
 
-        response = self.session.get(BASE_URL)
+        response = self.transport.get(BASE_URL)
         self._response_check(response)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        token_input = soup.find('input', attrs={'name': 'authenticity_token'})
+        with self._phase('parse'):
+            soup = BeautifulSoup(response.text, 'html.parser')
+            token_input = soup.find('input', attrs={'name': 'authenticity_token'})
 
         if token_input:
             authenticity_token = token_input.get('value')
@@ -91,15 +157,16 @@ class Gradescope:
             'commit': 'Log In',
             'session[remember_me_sso]': 0,
         }
-        response = self.session.post(LOGIN_URL, data=data)
+        response = self.transport.post(LOGIN_URL, data=data)
         self._response_check(response)
 
-        log.info(f'[Login] Current URL: {response.url}')
-        if 'account' in response.url:
+        response_url = str(response.url)
+        log.info(f'[Login] Current URL: {response_url}')
+        if 'account' in response_url:
             log.info('[Login] Login Successful.')
             self.logged_in = True
             return True
-        elif 'login' in response.url:
+        elif 'login' in response_url:
             log.warning('[Login] Login Failed.')
             self.logged_in = False
             return False
@@ -133,13 +200,350 @@ class Gradescope:
         if not self.logged_in:
             raise NotLoggedInError
 
-        response = self.session.get(BASE_URL)
+        response = self.transport.get(BASE_URL)
         self._response_check(response)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        with self._phase('parse'):
+            return self._parse_courses(response.text, role, as_dict)
+
+    @overload
+    def get_assignments(
+        self, course: Course, *, as_dataframe: Literal[False] = False, tz: str | tzinfo | None = None
+    ) -> list[Assignment]: ...
+    @overload
+    def get_assignments(
+        self, course: Course, *, as_dataframe: Literal[True], tz: str | tzinfo | None = None
+    ) -> pd.DataFrame: ...
+
+    def get_assignments(
+        self, course: Course, *, as_dataframe: bool = False, tz: str | tzinfo | None = None
+    ) -> list[Assignment] | pd.DataFrame:
+        '''
+        Retrieves the list of assignments for the specified course.
+
+        Args:
+            course (Course): The course for which to retrieve the assignments.
+            as_dataframe (bool, optional): If True, return a typed DataFrame with parsed dates
+                (see `assignments_to_dataframe`). If False, return a list of Assignment objects.
+                Defaults to False.
+            tz (str | tzinfo | None, optional): The time zone of the course, used to convert the
+                DataFrame dates to UTC. Defaults to the local time zone.
+
+        Returns:
+            list[Assignment] | pd.DataFrame:
+                - list of Assignment objects if `as_dataframe` is False
+                - DataFrame with one row per assignment if `as_dataframe` is True
+
+        Raises:
+            NotLoggedInError: If not logged in.
+            ResponseError: If the assignments table is empty or not found for the specified course.
+        '''
+        if not self.logged_in:
+            raise NotLoggedInError
+
+        response = self.transport.get(course.get_url() + '/assignments')
+        self._response_check(response)
+        with self._phase('parse'):
+            assignments = self._parse_assignments(response.text, course)
+        if as_dataframe:
+            with self._phase('model'):
+                return assignments_to_dataframe(assignments, tz)
+        return assignments
+
+    def get_assignments_as_student(self, course: Course) -> list[StudentAssignment]:
+        '''
+        Retrieves the list of assignments visible to a student for the specified course.
+
+        This method parses the student-facing assignment table on Gradescope to extract information such as
+        assignment title, submission status, scores, due dates, and template download links.
+
+        Args:
+            course (Course): The course for which to retrieve the assignments.
+
+        Returns:
+            list[StudentAssignment]: A list of StudentAssignment objects with assignment details.
+
+        Raises:
+            NotLoggedInError: If the user is not logged in.
+            ResponseError: If the assignments table cannot be found for the specified course.
+        '''
+        if not self.logged_in:
+            raise NotLoggedInError
+
+        response = self.transport.get(course.get_url())
+        self._response_check(response)
+        with self._phase('parse'):
+            return self._parse_student_assignments(response.text, course)
+
+    def get_student_dashboard(
+        self,
+        courses: list[Course] | None = None,
+        upcoming_only: bool = False,
+        max_workers: int = 8,
+    ) -> pd.DataFrame:
+        '''
+        Retrieves the assignments, deadlines and scores of every student course as one table.
+
+        The course pages are fetched concurrently and the combined table is sorted by due date.
+        Courses whose page cannot be fetched or has no student assignments table (e.g. courses the
+        user teaches) are logged and skipped.
+
+        Args:
+            courses (list[Course] | None, optional): The courses to include. Defaults to all student courses.
+            upcoming_only (bool, optional): If True, only keep assignments whose due date or late due date
+                has not passed yet. Defaults to False.
+            max_workers (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+        Returns:
+            pd.DataFrame: One row per assignment with the course, title, submission status, score
+                (also split into numeric `points` and `max_points`) and UTC release/due dates.
+
+        Raises:
+            NotLoggedInError: If the user is not logged in.
+        '''
+        if not self.logged_in:
+            raise NotLoggedInError
+
+        if courses is None:
+            courses = self.get_courses(Role.STUDENT)
+
+        def fetch(course: Course) -> list[StudentAssignment]:
+            # One failing course (e.g. a course the user is not a student of) must not hide the others
+            try:
+                return self.get_assignments_as_student(course)
+            except Exception as e:
+                log.warning(f'[Dashboard] Skipping course ID {course.course_id}: {e}')
+                return []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(fetch, courses))
+
+        rows = [
+            (course, assignment)
+            for course, assignments in zip(courses, results)
+            for assignment in assignments
+        ]
+        df = pd.DataFrame({
+            'course_id': pd.array([c.course_id for c, _ in rows], dtype='Int64'),
+            'course': [c.short_name for c, _ in rows],
+            'term': [c.term for c, _ in rows],
+            'assignment_id': pd.array([a.assignment_id for _, a in rows], dtype='Int64'),
+            'title': [a.title for _, a in rows],
+            'submitted': pd.array([a.submitted for _, a in rows], dtype='boolean'),
+            'score': [a.score for _, a in rows],
+            'release_date': [a.release_date for _, a in rows],
+            'due_date': [a.due_date for _, a in rows],
+            'late_due_date': [a.late_due_date for _, a in rows],
+            'submission_url': [a.submission_url for _, a in rows],
+        })
+
+        points = df['score'].astype('string').str.extract(r'([\d.]+)\s*/\s*([\d.]+)')
+        df.insert(7, 'points', pd.to_numeric(points[0]).astype('float64'))
+        df.insert(8, 'max_points', pd.to_numeric(points[1]).astype('float64'))
+        for column in ('release_date', 'due_date', 'late_due_date'):
+            df[column] = pd.to_datetime(df[column], utc=True, errors='coerce', format='ISO8601')
+
+        if upcoming_only:
+            now = pd.Timestamp.now(tz='UTC')
+            df = df[(df['due_date'] >= now) | (df['late_due_date'] >= now)]
+        return df.sort_values(['due_date', 'course', 'title'], na_position='last', ignore_index=True)
+
+    def get_members(self, course: Course) -> list[Member]:
+        '''
+        Retrieves the list of members for the specified course.
+
+        Args:
+            course (Course): The course for which to retrieve the members.
+
+        Returns:
+            list[Member]: The list of members for the specified course.
+
+        Raises:
+            NotLoggedInError: If not logged in.
+        '''
+        if not self.logged_in:
+            raise NotLoggedInError
+
+        response = self.transport.get(course.get_url() + '/memberships')
+        self._response_check(response)
+        with self._phase('parse'):
+            return self._parse_members(response.text, course)
+
+    # Returns None when the member does not exist in the course or assignment
+    def get_past_submissions(
+        self, course: Course, assignment: Assignment, member: Member
+    ) -> list[Submission]:
+        '''
+        Retrieves the list of past submissions for the specified course, assignment, and member.
+
+        Args:
+            course (Course): The course for which to retrieve the past submissions.
+            assignment (Assignment): The assignment for which to retrieve the past submissions.
+            member (Member): The member for which to retrieve the past submissions.
+
+        Returns:
+            list[Submission]: The list of past submissions for the specified course, assignment, and member.
+
+        Raises:
+            NotLoggedInError: If not logged in.
+        '''
+        if not self.logged_in:
+            raise NotLoggedInError
+
+        urls = past_submissions_urls(self.get_gradebook(course, member))
+        url = urls.get(assignment.assignment_id)
+        if url is None:
+            return None
+
+        return self._fetch_past_submissions(url, course.course_id, assignment.assignment_id, member.member_id)
+
+    def get_member_submissions(
+        self, course: Course, member: Member, assignments: list[Assignment] | None = None
+    ) -> list[Submission]:
+        '''
+        Retrieves the past submissions of a member for every assignment of a course.
+
+        The member's gradebook is fetched once and then the submission history of every assignment
+        the member has submitted to.
+
+        Args:
+            course (Course): The course for which to retrieve the past submissions.
+            member (Member): The member for which to retrieve the past submissions.
+            assignments (list[Assignment] | None, optional): Only include these assignments. Defaults to all assignments.
+
+        Returns:
+            list[Submission]: The past submissions of the member, grouped by assignment.
+
+        Raises:
+            NotLoggedInError: If not logged in.
+        '''
+        if not self.logged_in:
+            raise NotLoggedInError
+
+        urls = past_submissions_urls(self.get_gradebook(course, member))
+        if assignments is not None:
+            assignment_ids = {assignment.assignment_id for assignment in assignments}
+            urls = {assignment_id: url for assignment_id, url in urls.items() if assignment_id in assignment_ids}
+
+        submissions = list()
+        for assignment_id, url in urls.items():
+            submissions.extend(
+                self._fetch_past_submissions(url, course.course_id, assignment_id, member.member_id)
+            )
+        return submissions
+
+    def get_gradebook(self, course: Course, member: Member) -> dict:
+        '''
+        Retrieves the gradebook for a specific course and member.
+
+        Args:
+            course (Course): The course object.
+            member (Member): The member object.
+
+        Returns:
+            dict: The gradebook data as a dictionary.
+
+        Raises:
+            NotLoggedInError: If the user is not logged in.
+        '''
+        if not self.logged_in:
+            raise NotLoggedInError
+
+        url = GRADEBOOK.format(course_id=course.course_id, member_id=member.member_id)
+        response = self.transport.get(url, endpoint='json')
+        self._response_check(response)
+        with self._phase('parse'):
+            return json.loads(response.text)
+
+    def get_assignment_grades(self, assignment: Assignment) -> pd.DataFrame:
+        '''
+        Retrieves the grades for a specific assignment.
+
+        Args:
+            assignment (Assignment): The assignment object.
+
+        Returns:
+            pd.DataFrame: The assignment grades as a pandas DataFrame.
+
+        Raises:
+            NotLoggedInError: If the user is not logged in.
+        '''
+        if not self.logged_in:
+            raise NotLoggedInError
+
+        response = self.transport.get(assignment.get_grades_url(), endpoint='csv')
+        self._response_check(response)
+        with self._phase('parse'):
+            return self._parse_grades(response.content)
+
+    def prefetch(self, course: Course, grades: bool = False, max_workers: int = 8) -> Course:
+        '''
+        Loads the related data of a course concurrently and caches it on the model objects.
+
+        After this call `course.assignments`, `course.members` and (if `grades` is True)
+        `assignment.grades` for every assignment are available without further requests.
+
+        Args:
+            course (Course): The course to prefetch.
+            grades (bool, optional): Whether to also load the grades of every assignment. Defaults to False.
+            max_workers (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+        Returns:
+            Course: The same course, bound to this client.
+
+        Raises:
+            NotLoggedInError: If the user is not logged in.
+        '''
+        if not self.logged_in:
+            raise NotLoggedInError
+
+        course._bind(self)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            members = executor.submit(lambda: course.members)
+            assignments = course.assignments
+            if grades:
+                list(executor.map(lambda assignment: assignment.grades, assignments))
+            members.result()
+        return course
+
+    def download_file(self, path: str, url: str) -> None:
+        '''
+        Downloads a file from a given URL and saves it to the specified path.
+
+        Args:
+            path (str): The path where the file should be saved.
+            url (str): The URL of the file to be downloaded.
+
+        Raises:
+            NotLoggedInError: If the user is not logged in.
+        '''
+        if not self.logged_in:
+            raise NotLoggedInError
+
+        response = self.transport.get(url, endpoint='download')
+        self._response_check(response)
+        with open(path, 'wb') as file:
+            file.write(response.content)
+
+    def _parse_courses(
+        self, html: str, role: Role, as_dict: bool
+    ) -> list[Course] | dict[int, Course]:
+        '''
+        Parses the course lists of the account dashboard.
+
+        Args:
+            html (str): The HTML of the dashboard page.
+            role (Role): The role of the courses.
+            as_dict (bool): Whether to return a dict keyed by course ID.
+
+        Returns:
+            list[Course] | dict[int, Course]: The parsed courses.
+        '''
+        soup = BeautifulSoup(html, 'html.parser')
 
         courses_list: list[Course] = list()
         courses_dict: dict[int, Course] = dict()
         courses = courses_dict if as_dict else courses_list
+        rows: list[dict] = list()
 
         current_heading = soup.find('h1', text='Course Dashboard')
 
@@ -174,7 +578,7 @@ class Gradescope:
                                     class_='courseBox--shortname'
                                 )
                                 full_name_elm = course.find(class_='courseBox--name')
-                                course_obj = Course(
+                                rows.append(dict(
                                     course_id=course_id,
                                     url=str(href),
                                     role=Role(role.value),
@@ -189,81 +593,80 @@ class Gradescope:
                                         if full_name_elm
                                         else ''
                                     ),
-                                )
-
-                                if as_dict:
-                                    courses_dict[course_id] = course_obj
-                                else:
-                                    courses_list.append(course_obj)
+                                ))
 
         else:
             log.warning(f'Cannot find heading for Role: {role}')
             # raise ResponseError(f'Cannot find heading for Role: {role}')
+
+        with self._phase('model'):
+            for row in rows:
+                course_obj = Course(**row)._bind(self)
+                if as_dict:
+                    courses_dict[course_obj.course_id] = course_obj
+                else:
+                    courses_list.append(course_obj)
         return courses
 
-    def get_assignments(self, course: Course) -> list[Assignment]:
+    def _parse_assignments(self, html: str, course: Course) -> list[Assignment]:
         '''
-        Retrieves the list of assignments for the specified course.
+        Parses the assignments table of a course assignments page.
 
         Args:
-            course (Course): The course for which to retrieve the assignments.
+            html (str): The HTML of the assignments page.
+            course (Course): The course the page belongs to.
 
         Returns:
-            list[Assignment]: The list of assignments for the specified course.
+            list[Assignment]: The parsed assignments.
 
         Raises:
-            NotLoggedInError: If not logged in.
-            ResponseError: If the assignments table is empty or not found for the specified course.
+            ResponseError: If the assignments table is empty or not found.
         '''
-        if not self.logged_in:
-            raise NotLoggedInError
-
-        response = self.session.get(course.get_url() + '/assignments')
-        self._response_check(response)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(html, 'html.parser')
         assignments_data = soup.find('div', {'data-react-class': 'AssignmentsTable'})
 
         assignments = list()
         if assignments_data:
             assignments_data = json.loads(assignments_data.get('data-react-props'))
             if 'table_data' in assignments_data:
-                for data in assignments_data['table_data']:
-                    assignments.append(
-                        Assignment(
-                            assignment_id=self._parse_int(data.get('id')),
-                            assignment_type=data.get('type'),
-                            url=data.get('url'),
-                            title=data.get('title'),
-                            container_id=data.get('container_id'),
-                            versioned=data.get('is_versioned_assignment'),
-                            version_index=data.get('version_index'),
-                            version_name=data.get('version_name'),
-                            total_points=data.get('total_points'),
-                            student_submission=data.get('student_submission'),
-                            created_at=data.get('created_at'),
-                            release_date=data.get('submission_window', {}).get(
-                                'release_date'
-                            ),
-                            due_date=data.get('submission_window', {}).get('due_date'),
-                            hard_due_date=data.get('submission_window', {}).get(
-                                'hard_due_date'
-                            ),
-                            time_limit=data.get('submission_window', {}).get(
-                                'time_limit'
-                            ),
-                            active_submissions=data.get('num_active_submissions'),
-                            grading_progress=data.get('grading_progress'),
-                            published=data.get('is_published'),
-                            regrade_requests_open=data.get('regrade_requests_open'),
-                            regrade_requests_possible=data.get(
-                                'regrade_requests_possible'
-                            ),
-                            regrade_request_count=data.get(
-                                'open_regrade_request_count'
-                            ),
-                            due_or_created_at_date=data.get('due_or_created_at_date'),
+                with self._phase('model'):
+                    for data in assignments_data['table_data']:
+                        assignments.append(
+                            Assignment(
+                                assignment_id=self._parse_int(data.get('id')),
+                                assignment_type=data.get('type'),
+                                url=data.get('url'),
+                                title=data.get('title'),
+                                container_id=data.get('container_id'),
+                                versioned=data.get('is_versioned_assignment'),
+                                version_index=data.get('version_index'),
+                                version_name=data.get('version_name'),
+                                total_points=data.get('total_points'),
+                                student_submission=data.get('student_submission'),
+                                created_at=data.get('created_at'),
+                                release_date=data.get('submission_window', {}).get(
+                                    'release_date'
+                                ),
+                                due_date=data.get('submission_window', {}).get('due_date'),
+                                hard_due_date=data.get('submission_window', {}).get(
+                                    'hard_due_date'
+                                ),
+                                time_limit=data.get('submission_window', {}).get(
+                                    'time_limit'
+                                ),
+                                active_submissions=data.get('num_active_submissions'),
+                                grading_progress=data.get('grading_progress'),
+                                published=data.get('is_published'),
+                                regrade_requests_open=data.get('regrade_requests_open'),
+                                regrade_requests_possible=data.get(
+                                    'regrade_requests_possible'
+                                ),
+                                regrade_request_count=data.get(
+                                    'open_regrade_request_count'
+                                ),
+                                due_or_created_at_date=data.get('due_or_created_at_date'),
+                            )._bind(self, course=course)
                         )
-                    )
                 return assignments
             else:
                 raise ResponseError(
@@ -273,125 +676,96 @@ class Gradescope:
             f'Assignments Table not found for course ID: {course.course_id}'
         )
 
-    def get_assignments_as_student(self, course: Course) -> list[StudentAssignment]:
+    def _parse_student_assignments(self, html: str, course: Course) -> list[StudentAssignment]:
         '''
-        Retrieves the list of assignments visible to a student for the specified course.
+        Parses the student assignments table of a course page.
 
-        This method parses the student-facing assignment table on Gradescope to extract information such as
-        assignment title, submission status, scores, due dates, and template download links.
+        Only the assignments table is built into a tree, and each row is walked once.
 
         Args:
-            course (Course): The course for which to retrieve the assignments.
+            html (str): The HTML of the course page.
+            course (Course): The course the page belongs to.
 
         Returns:
-            list[StudentAssignment]: A list of StudentAssignment objects with assignment details.
+            list[StudentAssignment]: The parsed assignments.
 
         Raises:
-            NotLoggedInError: If the user is not logged in.
-            ResponseError: If the assignments table cannot be found for the specified course.
+            ResponseError: If the assignments table cannot be found.
         '''
-        if not self.logged_in:
-            raise NotLoggedInError
-
-        response = self.session.get(course.get_url())
-        self._response_check(response)
-        soup = BeautifulSoup(response.text, 'html.parser')
-
+        soup = BeautifulSoup(
+            html, 'html.parser', parse_only=SoupStrainer('table', id='assignments-student-table')
+        )
         assignments_table = soup.find('table', {'id': 'assignments-student-table'})
         if not assignments_table:
             raise ResponseError(
                 f'Student assignments table not found for course ID: {course.course_id}'
             )
 
-        assignments = []
-        rows = assignments_table.find('tbody').find_all('tr')
-
-        for row in rows:
+        rows = []
+        tbody = assignments_table.find('tbody') or assignments_table
+        for row in tbody.find_all('tr'):
             title_cell = row.find('th', class_='table--primaryLink')
             if not title_cell:
                 continue
 
             title_button = title_cell.find('button')
+            attrs = title_button.attrs if title_button else {}
             title = (
                 title_button.get_text(strip=True)
                 if title_button
                 else title_cell.get_text(strip=True)
             )
             assignment_id = (
-                int(title_button['data-assignment-id'])
-                if title_button and 'data-assignment-id' in title_button.attrs
-                else None
-            )
-            submission_url = (
-                title_button['data-post-url']
-                if title_button and 'data-post-url' in title_button.attrs
-                else None
-            )
-            template_url = (
-                title_button.get('data-template-url')
-                if title_button and 'data-template-url' in title_button.attrs
-                else None
+                int(attrs['data-assignment-id']) if 'data-assignment-id' in attrs else None
             )
 
             status_cell = row.find('td', class_='submissionStatus')
-            submitted = (
-                'submissionStatus-complete' in status_cell.get('class', [])
-                if status_cell
-                else False
-            )
-            score_div = (
-                status_cell.find('div', class_='submissionStatus--score')
-                if status_cell
-                else None
-            )
-            score = score_div.get_text(strip=True) if score_div else None
-
-            release_time = row.find('time', class_='submissionTimeChart--releaseDate')
-            due_time = row.find('time', class_='submissionTimeChart--dueDate')
-
-            # Some rows have two due time elements (for late due date)
-            all_due_times = row.find_all('time', class_='submissionTimeChart--dueDate')
-            late_due_time = (
-                all_due_times[1]['datetime'] if len(all_due_times) > 1 else None
-            )
-
-            assignments.append(
-                StudentAssignment(
-                    assignment_id=assignment_id,
-                    title=title,
-                    submission_url=submission_url,
-                    template_url=template_url,
-                    submitted=submitted,
-                    score=score,
-                    release_date=release_time['datetime'] if release_time else None,
-                    due_date=due_time['datetime'] if due_time else None,
-                    late_due_date=late_due_time,
-                )
-            )
-
-        return assignments
-
-    def get_members(self, course: Course) -> list[Member]:
+            submitted = False
+            score = None
+            if status_cell:
+                submitted = 'submissionStatus-complete' in status_cell.get('class', [])
+                score_div = status_cell.find('div', class_='submissionStatus--score')
+                score = score_div.get_text(strip=True) if score_div else None
+
+            # One pass over the time elements; some rows have a second due date (late due date)
+            release_date = None
+            due_dates = []
+            for time_elm in row.find_all('time'):
+                classes = time_elm.get('class', [])
+                if 'submissionTimeChart--releaseDate' in classes and release_date is None:
+                    release_date = time_elm.get('datetime')
+                elif 'submissionTimeChart--dueDate' in classes:
+                    due_dates.append(time_elm.get('datetime'))
+
+            rows.append(dict(
+                assignment_id=assignment_id,
+                title=title,
+                submission_url=attrs.get('data-post-url'),
+                template_url=attrs.get('data-template-url'),
+                submitted=submitted,
+                score=score,
+                release_date=release_date,
+                due_date=due_dates[0] if due_dates else None,
+                late_due_date=due_dates[1] if len(due_dates) > 1 else None,
+            ))
+
+        with self._phase('model'):
+            return [StudentAssignment(**row) for row in rows]
+
+    def _parse_members(self, html: str, course: Course) -> list[Member]:
         '''
-        Retrieves the list of members for the specified course.
+        Parses the roster table of a course memberships page.
 
         Args:
-            course (Course): The course for which to retrieve the members.
+            html (str): The HTML of the memberships page.
+            course (Course): The course the page belongs to.
 
         Returns:
-            list[Member]: The list of members for the specified course.
-
-        Raises:
-            NotLoggedInError: If not logged in.
+            list[Member]: The parsed members.
         '''
-        if not self.logged_in:
-            raise NotLoggedInError
-
-        response = self.session.get(course.get_url() + '/memberships')
-        self._response_check(response)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(html, 'html.parser')
 
-        members = list()
+        rows = list()
         for entry in soup.findAll('table')[0].findAll('tr'):
             id_button = entry.find('button', class_='js-rosterName')
             if id_button:
@@ -404,7 +778,7 @@ class Gradescope:
                 role = other_info_button.get('data-role')
                 email = other_info_button.get('data-email')
 
-                member = Member(
+                rows.append(dict(
                     member_id=user_id,
                     full_name=data_cm.get('full_name'),
                     first_name=data_cm.get('first_name'),
@@ -412,121 +786,79 @@ class Gradescope:
                     role=role,
                     sid=data_cm.get('sid'),
                     email=email,
-                )
-                members.append(member)
-        return members
+                ))
 
-    # Returns None when the member does not exist in the course or assignment
-    def get_past_submissions(
-        self, course: Course, assignment: Assignment, member: Member
+        with self._phase('model'):
+            return [Member(**row)._bind(self, course=course) for row in rows]
+
+    def _fetch_past_submissions(
+        self, url: str, course_id: int, assignment_id: int, member_id: int
     ) -> list[Submission]:
         '''
-        Retrieves the list of past submissions for the specified course, assignment, and member.
+        Fetches and parses the past submissions of a submission.
 
         Args:
-            course (Course): The course for which to retrieve the past submissions.
-            assignment (Assignment): The assignment for which to retrieve the past submissions.
-            member (Member): The member for which to retrieve the past submissions.
+            url (str): The past submissions URL of the submission (see `past_submissions_urls`).
+            course_id (int): The course ID of the submissions.
+            assignment_id (int): The assignment ID of the submissions.
+            member_id (int): The member ID of the submissions.
 
         Returns:
-            list[Submission]: The list of past submissions for the specified course, assignment, and member.
-
-        Raises:
-            NotLoggedInError: If not logged in.
+            list[Submission]: The parsed submissions.
         '''
-        if not self.logged_in:
-            raise NotLoggedInError
-
-        gradebook = self.get_gradebook(course, member)
-        url = None
-        for item in gradebook:
-            item_data = item.get('assignment')
-            if item_data.get('id') == assignment.assignment_id:
-                url = item_data.get('submission').get('url')
-                break
-
-        if url is None:
-            return None
-
-        response = self.session.get(urljoin(BASE_URL, url + PAST_SUBMISSIONS))
+        response = self.transport.get(url, endpoint='json')
         self._response_check(response)
-        json_data = json.loads(response.text)['past_submissions']
-
-        submissions = list()
-        for data in json_data:
-            submissions.append(
-                Submission(
-                    course_id=course.course_id,
-                    assignment_id=assignment.assignment_id,
-                    member_id=member.member_id,
-                    submission_id=data.get('id'),
-                    created_at=data.get('created_at'),
-                    score=float(data.get('score')) if data.get('score') else None,
-                    url=data.get('show_path'),
-                )
-            )
-        return submissions
+        with self._phase('parse'):
+            return self._parse_past_submissions(response.text, course_id, assignment_id, member_id)
 
-    def get_gradebook(self, course: Course, member: Member) -> dict:
+    def _parse_past_submissions(
+        self, text: str, course_id: int, assignment_id: int, member_id: int
+    ) -> list[Submission]:
         '''
-        Retrieves the gradebook for a specific course and member.
+        Parses the past submissions JSON of a submission.
 
         Args:
-            course (Course): The course object.
-            member (Member): The member object.
+            text (str): The JSON response of the past submissions endpoint.
+            course_id (int): The course ID of the submissions.
+            assignment_id (int): The assignment ID of the submissions.
+            member_id (int): The member ID of the submissions.
 
         Returns:
-            dict: The gradebook data as a dictionary.
-
-        Raises:
-            NotLoggedInError: If the user is not logged in.
+            list[Submission]: The parsed submissions.
         '''
-        if not self.logged_in:
-            raise NotLoggedInError
-
-        url = GRADEBOOK.format(course_id=course.course_id, member_id=member.member_id)
-        response = self.session.get(url)
-        self._response_check(response)
-        return json.loads(response.text)
+        json_data = json.loads(text)['past_submissions']
+
+        with self._phase('model'):
+            submissions = list()
+            for data in json_data:
+                submissions.append(
+                    Submission(
+                        course_id=course_id,
+                        assignment_id=assignment_id,
+                        member_id=member_id,
+                        submission_id=data.get('id'),
+                        created_at=data.get('created_at'),
+                        score=float(data.get('score')) if data.get('score') else None,
+                        url=data.get('show_path'),
+                    )
+                )
+        return submissions
 
-    def get_assignment_grades(self, assignment: Assignment) -> pd.DataFrame:
+    def _parse_grades(self, content: bytes) -> pd.DataFrame:
         '''
-        Retrieves the grades for a specific assignment.
+        Parses a scores.csv export.
 
         Args:
-            assignment (Assignment): The assignment object.
+            content (bytes): The raw CSV content.
 
         Returns:
-            pd.DataFrame: The assignment grades as a pandas DataFrame.
-
-        Raises:
-            NotLoggedInError: If the user is not logged in.
+            pd.DataFrame: The grades as a pandas DataFrame.
         '''
-        if not self.logged_in:
-            raise NotLoggedInError
-
-        response = self.session.get(assignment.get_grades_url())
-        self._response_check(response)
-        return pd.read_csv(io.StringIO(response.content.decode('utf-8')), skiprows=2)
+        return pd.read_csv(io.StringIO(content.decode('utf-8')), skiprows=2)
 
-    def download_file(self, path: str, url: str) -> None:
-        '''
-        Downloads a file from a given URL and saves it to the specified path.
-
-        Args:
-            path (str): The path where the file should be saved.
-            url (str): The URL of the file to be downloaded.
-
-        Raises:
-            NotLoggedInError: If the user is not logged in.
-        '''
-        if not self.logged_in:
-            raise NotLoggedInError
-
-        response = self.session.get(url)
-        self._response_check(response)
-        with open(path, 'wb') as file:
-            file.write(response.content)
+    def _phase(self, name: str):
+        '''Returns a context manager recording the enclosed block as phase `name` when profiling.'''
+        return self.profiler.phase(name) if self.profiler is not None else _NO_PHASE
 
     def _response_check(self, response: requests.Response) -> bool:
         '''
@@ -562,7 +894,7 @@ class Gradescope:
 
     def _to_datetime(self, text: str) -> datetime:
         '''
-        Converts a string to a datetime object.
+        Converts an ISO 8601 string (with optional seconds and UTC offset) to a datetime object.
 
         Args:
             text (str): The string to be converted.
@@ -570,4 +902,4 @@ class Gradescope:
         Returns:
             datetime: The converted datetime object.
         '''
-        return datetime.strptime(text, '%Y-%m-%dT%H:%M')
+        return datetime.fromisoformat(text)
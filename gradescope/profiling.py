@@ -0,0 +1,263 @@
+# profiling.py
+
+import sys
+import time
+import functools
+import threading
+import tracemalloc
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+# Exclusive metrics only, so flame graph tools do not count nested phases twice
+COLLAPSED_METRICS = ('self_cpu', 'self_wall', 'self_net_bytes')
+
+@dataclass
+class PhaseStats:
+    '''Represents the aggregated measurements of one call path (e.g. get_members -> parse).'''
+    calls: int = 0
+    wall: float = 0.0
+    cpu: float = 0.0
+    net_bytes: int = 0
+    net_blocks: int = 0
+    peak_bytes: int = 0
+    peak_calls: int = 0
+
+
+class _Frame:
+    __slots__ = ('path', 'wall', 'cpu', 'current', 'peak', 'blocks', 'shared', 'overlaps')
+
+    def __init__(self, path: tuple[str, ...]) -> None:
+        self.path = path
+        self.peak = 0
+
+
+class _Phase:
+    __slots__ = ('profiler', 'name', 'frame')
+
+    def __init__(self, profiler: 'Profiler', name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.frame = self.profiler._enter(self.name)
+
+    def __exit__(self, *exc: Any) -> None:
+        self.profiler._exit(self.frame)
+
+
+class Profiler:
+    '''
+    Records CPU time, wall time and memory per call path.
+
+    Call paths are built from nested `phase` blocks, e.g. ('Gradescope.get_members', 'network').
+    Measurements are inclusive of nested phases; `collapsed` reports exclusive (self) values.
+    Each thread keeps its own stack, so work done in worker threads starts a new root path.
+
+    Memory is measured with tracemalloc, which is process-wide: net bytes of a phase include
+    allocations made concurrently by other threads. The traced peak can only be reset for the
+    whole process, so peak bytes are only recorded for calls that did not overlap a phase running
+    in another thread (`peak_calls` counts them); under concurrency (prefetch, dashboard, export)
+    they may be missing. Net blocks is the change in the number of allocated memory blocks
+    (`sys.getallocatedblocks`).
+    '''
+
+    def __init__(self, trace_memory: bool = True) -> None:
+        '''
+        Initializes a Profiler object.
+
+        Args:
+            trace_memory (bool): Whether to record memory with tracemalloc (slower). Defaults to True.
+        '''
+        self.trace_memory = trace_memory
+        self.stats: dict[tuple[str, ...], PhaseStats] = dict()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+        self._active = 0  # threads with a phase in progress
+        self._overlaps = 0  # phases started while another thread had one in progress
+
+    def start(self) -> None:
+        '''Starts tracemalloc if memory tracing is enabled and it is not already running.'''
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        '''Stops tracemalloc if it was started by this profiler.'''
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def reset(self) -> None:
+        '''Discards all recorded measurements.'''
+        with self._lock:
+            self.stats.clear()
+
+    def _stack(self) -> list[_Frame]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _enter(self, name: str) -> _Frame:
+        stack = self._stack()
+        frame = _Frame((stack[-1].path if stack else ()) + (name,))
+        with self._lock:
+            if not stack:
+                self._active += 1
+                if self._active > 1:
+                    self._overlaps += 1
+            frame.shared = self._active > 1
+            frame.overlaps = self._overlaps
+        if self.trace_memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                # Keep the parent's peak so far before resetting it for this phase
+                stack[-1].peak = max(stack[-1].peak, peak)
+            if not frame.shared:
+                # The peak is process-wide; resetting it would corrupt phases running in other threads
+                tracemalloc.reset_peak()
+            frame.current = current
+        else:
+            frame.current = None
+        frame.blocks = sys.getallocatedblocks()
+        stack.append(frame)
+        frame.cpu = time.thread_time()
+        frame.wall = time.perf_counter()
+        return frame
+
+    def _exit(self, frame: _Frame) -> None:
+        wall = time.perf_counter() - frame.wall
+        cpu = time.thread_time() - frame.cpu
+        blocks = sys.getallocatedblocks() - frame.blocks
+        net_bytes = 0
+        peak_bytes = None
+        stack = self._stack()
+        stack.pop()
+        with self._lock:
+            overlapped = frame.shared or self._active > 1 or self._overlaps != frame.overlaps
+            if not stack:
+                self._active -= 1
+
+        if frame.current is not None and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            frame.peak = max(frame.peak, peak)
+            net_bytes = current - frame.current
+            if not overlapped:
+                peak_bytes = max(frame.peak - frame.current, 0)
+        if stack:
+            stack[-1].peak = max(stack[-1].peak, frame.peak)
+
+        with self._lock:
+            stats = self.stats.setdefault(frame.path, PhaseStats())
+            stats.calls += 1
+            stats.wall += wall
+            stats.cpu += cpu
+            stats.net_bytes += net_bytes
+            stats.net_blocks += blocks
+            if peak_bytes is not None:
+                stats.peak_bytes = max(stats.peak_bytes, peak_bytes)
+                stats.peak_calls += 1
+
+    def phase(self, name: str) -> '_Phase':
+        '''Returns a context manager measuring the enclosed block as phase `name`.'''
+        return _Phase(self, name)
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        '''Returns `func` wrapped so that every call is measured as phase `name`.'''
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    def to_dataframe(self) -> pd.DataFrame:
+        '''
+        Returns the measurements as a DataFrame with one row per call path.
+
+        Inclusive columns: calls, wall, cpu, net_bytes, net_blocks, peak_bytes.
+        Exclusive columns: self_wall, self_cpu, self_net_bytes (not spent or allocated in nested phases).
+        `peak_bytes` is NaN for paths whose calls all overlapped other threads (see the class docstring).
+        '''
+        with self._lock:
+            items = sorted((path, PhaseStats(**vars(stats))) for path, stats in self.stats.items())
+
+        children_wall: dict[tuple[str, ...], float] = dict()
+        children_cpu: dict[tuple[str, ...], float] = dict()
+        children_bytes: dict[tuple[str, ...], int] = dict()
+        for path, stats in items:
+            if len(path) > 1:
+                children_wall[path[:-1]] = children_wall.get(path[:-1], 0.0) + stats.wall
+                children_cpu[path[:-1]] = children_cpu.get(path[:-1], 0.0) + stats.cpu
+                children_bytes[path[:-1]] = children_bytes.get(path[:-1], 0) + stats.net_bytes
+
+        df = pd.DataFrame({
+            'path': [' > '.join(path) for path, _ in items],
+            'depth': [len(path) - 1 for path, _ in items],
+            'calls': [s.calls for _, s in items],
+            'wall': [s.wall for _, s in items],
+            'cpu': [s.cpu for _, s in items],
+            'self_wall': [max(s.wall - children_wall.get(p, 0.0), 0.0) for p, s in items],
+            'self_cpu': [max(s.cpu - children_cpu.get(p, 0.0), 0.0) for p, s in items],
+            'net_bytes': [s.net_bytes for _, s in items],
+            'self_net_bytes': [s.net_bytes - children_bytes.get(p, 0) for p, s in items],
+            'net_blocks': [s.net_blocks for _, s in items],
+            'peak_bytes': [s.peak_bytes if s.peak_calls else np.nan for _, s in items],
+        })
+        return df
+
+    def report(self) -> str:
+        '''Returns the measurements formatted as an indented table.'''
+        df = self.to_dataframe()
+        lines = [
+            f'{"phase":<44}{"calls":>7}{"wall (s)":>10}{"cpu (s)":>10}{"self cpu":>10}'
+            f'{"net KiB":>10}{"peak KiB":>10}{"blocks":>9}'
+        ]
+        for row in df.itertuples():
+            name = '  ' * row.depth + row.path.split(' > ')[-1]
+            peak = f'{row.peak_bytes / 1024:>10.1f}' if pd.notna(row.peak_bytes) else f'{"-":>10}'
+            lines.append(
+                f'{name:<44}{row.calls:>7}{row.wall:>10.3f}{row.cpu:>10.3f}{row.self_cpu:>10.3f}'
+                f'{row.net_bytes / 1024:>10.1f}{peak}{row.net_blocks:>9}'
+            )
+        return '\n'.join(lines)
+
+    def collapsed(self, metric: str = 'self_cpu') -> str:
+        '''
+        Returns the measurements in collapsed-stack format ("a;b;c value" per line), as read by
+        flamegraph.pl and speedscope.
+
+        Args:
+            metric (str): 'self_cpu' or 'self_wall' (reported in microseconds), or 'self_net_bytes'.
+                Defaults to 'self_cpu'.
+
+        Returns:
+            str: One line per call path.
+
+        Raises:
+            ValueError: If the metric is not one of the exclusive metrics.
+        '''
+        if metric not in COLLAPSED_METRICS:
+            raise ValueError(f'Unknown metric {metric!r}, expected one of {COLLAPSED_METRICS}.')
+        df = self.to_dataframe()
+        scale = 1 if metric == 'self_net_bytes' else 1e6
+        lines = []
+        for path, value in zip(df['path'], df[metric]):
+            value = int(round(value * scale))
+            if value > 0:
+                lines.append(f'{path.replace(" > ", ";")} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def save_collapsed(self, path: str, metric: str = 'self_cpu') -> None:
+        '''
+        Saves the measurements in collapsed-stack format. See `collapsed`.
+
+        Args:
+            path (str): The path of the output file.
+            metric (str): The metric to write. Defaults to 'self_cpu'.
+        '''
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(self.collapsed(metric))
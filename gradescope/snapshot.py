@@ -0,0 +1,291 @@
+# snapshot.py
+
+import os
+import dataclasses
+import numpy as np
+import logging as log
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+from .constants import Role
+from .dataclass import Course, Assignment, Member, Submission, _Related
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from .gradescope import Gradescope
+
+
+SNAPSHOT_VERSION = '1'
+SNAPSHOT_VERSION_KEY = b'gradescope.snapshot.version'
+SUPPORTED_VERSIONS = {'1'}
+SNAPSHOT_TABLES = {
+    'courses': Course,
+    'assignments': Assignment,
+    'members': Member,
+    'submissions': Submission,
+}
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.ipc
+    except ImportError as e:
+        raise ImportError('Snapshots require pyarrow: pip install gradescope-tool[snapshot]') from e
+    return pyarrow
+
+
+def _column(pa, name: str, values: list) -> 'pa.Array':
+    '''Builds an Arrow column, falling back to strings when the values have mixed types.'''
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        types = sorted({type(v).__name__ for v in values if v is not None})
+        log.warning(f'[Snapshot] Column {name} has mixed types ({", ".join(types)}); saving it as strings.')
+        return pa.array([None if v is None else str(v) for v in values], pa.string())
+
+
+def _table(pa, cls: type, objects: list, extra: dict[str, list] | None = None) -> 'pa.Table':
+    '''Converts a list of dataclass objects into an Arrow table with one column per field.'''
+    columns = dict(extra or {})
+    for field in dataclasses.fields(cls):
+        values = [getattr(o, field.name) for o in objects]
+        if field.name == 'role' and cls is Course:
+            values = [v.value if isinstance(v, Role) else v for v in values]
+        columns[field.name] = values
+    return pa.table({name: _column(pa, name, values) for name, values in columns.items()})
+
+
+def _related_or_none(course: Course, name: str) -> list | None:
+    '''Returns the related data of a course, loading it if possible, or None if it is not available.'''
+    if course.is_loaded(name) or getattr(course, '_client', None) is not None:
+        return getattr(course, name)
+    log.warning(
+        f'[Snapshot] Course {course.course_id} has no {name} loaded and is not bound to a client; '
+        f'saving it without {name}.'
+    )
+    return None
+
+
+def save_snapshot(
+    path: str,
+    courses: list[Course],
+    submissions: list[Submission] | None = None,
+    compression: str | None = None,
+) -> None:
+    '''
+    Save a course graph (courses, their assignments and members, and submissions) as a snapshot.
+
+    The snapshot is a directory of Arrow IPC files, one per model type, with a `course_id` column
+    linking assignments and members to their course. Assignments and members are taken from each
+    course's cache, and are loaded through its client if needed (see `Gradescope.prefetch`).
+    Courses that have neither are saved without them (with a warning), and are marked so that
+    they are loaded from Gradescope again after `load_snapshot`.
+
+    Args:
+        path: The directory to write the snapshot to. Created if missing.
+        courses: The courses to save.
+        submissions: The submissions to save (default is None).
+        compression: 'lz4' or 'zstd' to compress the files. Compressed snapshots are smaller but
+            cannot be memory-mapped without copying (default is None).
+
+    Returns:
+        None
+    '''
+    pa = _require_pyarrow()
+    os.makedirs(path, exist_ok=True)
+
+    assignments, assignment_course_ids = [], []
+    members, member_course_ids = [], []
+    saved = {'assignments': [], 'members': []}
+    for course in courses:
+        course_assignments = _related_or_none(course, 'assignments')
+        for assignment in course_assignments or []:
+            assignments.append(assignment)
+            assignment_course_ids.append(course.course_id)
+        course_members = _related_or_none(course, 'members')
+        for member in course_members or []:
+            members.append(member)
+            member_course_ids.append(course.course_id)
+        saved['assignments'].append(course_assignments is not None)
+        saved['members'].append(course_members is not None)
+
+    tables = {
+        'courses': _table(pa, Course, courses, {f'has_{name}': flags for name, flags in saved.items()}),
+        'assignments': _table(pa, Assignment, assignments, {'course_id': assignment_course_ids}),
+        'members': _table(pa, Member, members, {'course_id': member_course_ids}),
+        'submissions': _table(pa, Submission, submissions or []),
+    }
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    for name, table in tables.items():
+        table = table.replace_schema_metadata({SNAPSHOT_VERSION_KEY: SNAPSHOT_VERSION})
+        with pa.OSFile(os.path.join(path, f'{name}.arrow'), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+                writer.write_table(table)
+
+
+class LazyRecords(Sequence):
+    '''
+    A read-only sequence of model objects backed by rows of an Arrow table.
+
+    Each object is built from its row on first access and then kept, so iterating over part of
+    a large snapshot only pays for the rows that are actually used.
+    '''
+
+    def __init__(self, table: 'pa.Table', cls: type, indices: np.ndarray, bind: dict[str, Any] | None = None) -> None:
+        self._table = table
+        self._cls = cls
+        self._indices = indices
+        self._bind_args = bind
+        self._objects: dict[int, Any] = {}
+        self._names = [field.name for field in dataclasses.fields(cls)]
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('LazyRecords index out of range')
+        if index not in self._objects:
+            row = int(self._indices[index])
+            values = {name: self._table.column(name)[row].as_py() for name in self._names}
+            if self._cls is Course and values['role'] is not None:
+                values['role'] = Role(values['role'])
+            obj = self._cls(**values)
+            if self._bind_args is not None:
+                obj._bind(**self._bind_args)
+            self._objects[index] = obj
+        return self._objects[index]
+
+    def __repr__(self) -> str:
+        return f'LazyRecords({self._cls.__name__}, {len(self)} rows)'
+
+
+class Snapshot:
+    '''
+    A course graph loaded from a snapshot written by `save_snapshot`.
+
+    The Arrow files are memory-mapped, so loading only reads the file footers; model objects are
+    rebuilt as they are accessed. Courses come with their `assignments` and `members` already
+    cached, and are bound to `client` (if given) so invalidated data is refetched from Gradescope.
+    Data that was not available when the snapshot was saved is not cached, so it is fetched too.
+    '''
+
+    def __init__(self, path: str, client: 'Gradescope | None' = None) -> None:
+        '''
+        Initializes a Snapshot object.
+
+        Args:
+            path (str): The snapshot directory.
+            client (Gradescope | None): The client to bind the loaded objects to. Defaults to None.
+
+        Raises:
+            ValueError: If a file was written in a snapshot format this version cannot read.
+        '''
+        self._pa = _require_pyarrow()
+        self.path = path
+        self.client = client
+        self.tables: dict[str, 'pa.Table'] = {}
+        for name in SNAPSHOT_TABLES:
+            file_path = os.path.join(path, f'{name}.arrow')
+            reader = self._pa.ipc.open_file(self._pa.memory_map(file_path, 'r'))
+            # Files written before the version key was checked are version 1
+            version = (reader.schema.metadata or {}).get(SNAPSHOT_VERSION_KEY, b'1').decode()
+            if version not in SUPPORTED_VERSIONS:
+                raise ValueError(
+                    f'{file_path} has snapshot format version {version}, but only versions '
+                    f'{", ".join(sorted(SUPPORTED_VERSIONS))} can be read. Upgrade gradescope-tool or re-save the snapshot.'
+                )
+            self.tables[name] = reader.read_all()
+
+        self._groups = {name: self._group_by_course(self.tables[name]) for name in ('assignments', 'members')}
+        self._courses = None
+
+    @staticmethod
+    def _group_by_course(table: 'pa.Table') -> dict[int, np.ndarray]:
+        '''Returns the row indices of the table for each course ID.'''
+        if table.num_rows == 0:
+            return {}
+        course_ids = table.column('course_id').to_numpy()
+        order = np.argsort(course_ids, kind='stable')
+        keys, starts = np.unique(course_ids[order], return_index=True)
+        return {int(key): rows for key, rows in zip(keys, np.split(order, starts[1:]))}
+
+    def _records(self, name: str, indices: np.ndarray, **parents: Any) -> LazyRecords:
+        cls = SNAPSHOT_TABLES[name]
+        bind = {'client': self.client, **parents} if issubclass(cls, _Related) else None
+        return LazyRecords(self.tables[name], cls, indices, bind)
+
+    @property
+    def courses(self) -> list[Course]:
+        '''The courses in the snapshot, with their assignments and members cached lazily.'''
+        if self._courses is None:
+            table = self.tables['courses']
+            self._courses = list(self._records('courses', np.arange(table.num_rows)))
+            empty = np.array([], dtype=np.int64)
+            saved = {
+                name: table.column(f'has_{name}').to_pylist() if f'has_{name}' in table.column_names else None
+                for name in ('assignments', 'members')
+            }
+            for row, course in enumerate(self._courses):
+                cache = course.__dict__.setdefault('_cache', {})
+                for name in ('assignments', 'members'):
+                    if saved[name] is not None and not saved[name][row]:
+                        continue
+                    indices = self._groups[name].get(course.course_id, empty)
+                    cache[name] = self._records(name, indices, course=course)
+        return self._courses
+
+    def get_submissions(
+        self,
+        course_id: int | None = None,
+        assignment_id: int | None = None,
+        member_id: Any = None,
+    ) -> LazyRecords:
+        '''
+        Returns the submissions in the snapshot matching all of the given IDs.
+
+        Args:
+            course_id (int | None): The course ID to filter on. Defaults to None.
+            assignment_id (int | None): The assignment ID to filter on. Defaults to None.
+            member_id (Any): The member ID to filter on. Defaults to None.
+
+        Returns:
+            LazyRecords: The matching Submission objects.
+        '''
+        pc = self._pa.compute
+        table = self.tables['submissions']
+        if table.num_rows == 0:
+            return self._records('submissions', np.array([], dtype=np.int64))
+
+        mask = None
+        for name, value in (('course_id', course_id), ('assignment_id', assignment_id), ('member_id', member_id)):
+            if value is not None:
+                column = table.column(name)
+                if self._pa.types.is_string(column.type):
+                    value = str(value)
+                condition = pc.equal(column, self._pa.scalar(value, column.type))
+                mask = condition if mask is None else pc.and_(mask, condition)
+        if mask is None:
+            indices = np.arange(table.num_rows)
+        else:
+            indices = np.flatnonzero(pc.fill_null(mask, False).to_numpy(zero_copy_only=False))
+        return self._records('submissions', indices)
+
+
+def load_snapshot(path: str, client: 'Gradescope | None' = None) -> Snapshot:
+    '''
+    Load a snapshot written by `save_snapshot`.
+
+    Args:
+        path: The snapshot directory.
+        client: The Gradescope client to bind the loaded objects to (default is None).
+
+    Returns:
+        The loaded Snapshot.
+    '''
+    return Snapshot(path, client)
@@ -0,0 +1,190 @@
+# transport.py
+
+import requests
+from abc import ABC, abstractmethod
+from requests.adapters import HTTPAdapter
+from typing import Any
+
+
+# (connect, read) timeouts in seconds per endpoint class
+DEFAULT_TIMEOUTS = {
+    'page': (5.0, 30.0),
+    'json': (5.0, 30.0),
+    'csv': (5.0, 120.0),
+    'download': (5.0, 600.0),
+}
+
+
+def _brotli_available() -> bool:
+    '''Returns True if a brotli decoder is installed for the HTTP backends to use.'''
+    for module in ('brotli', 'brotlicffi'):
+        try:
+            __import__(module)
+            return True
+        except ImportError:
+            pass
+    return False
+
+
+class Transport(ABC):
+    '''
+    Base class for the HTTP backend used by the Gradescope client.
+
+    A transport performs GET and POST requests and returns response objects exposing
+    `status_code`, `url`, `text` and `content`. Every request belongs to an endpoint class
+    ('page', 'json', 'csv' or 'download') which selects its (connect, read) timeout.
+    Backends implement `get`, `post` and `close`, and list the exception types their requests
+    raise on connection errors and timeouts in `exceptions`.
+    '''
+
+    exceptions: tuple[type[Exception], ...] = ()
+
+    def __init__(
+        self,
+        timeouts: dict[str, tuple[float, float]] | None = None,
+        compression: bool | str = True,
+    ) -> None:
+        '''
+        Initializes a Transport object.
+
+        Args:
+            timeouts (dict[str, tuple[float, float]] | None): (connect, read) timeouts per endpoint class,
+                merged over DEFAULT_TIMEOUTS. Defaults to None.
+            compression (bool | str): True to negotiate gzip/deflate (and brotli when a decoder is installed),
+                False to request uncompressed responses, or an explicit Accept-Encoding value. Defaults to True.
+        '''
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        if compression is True:
+            self.accept_encoding = 'gzip, deflate, br' if _brotli_available() else 'gzip, deflate'
+        elif compression is False:
+            self.accept_encoding = 'identity'
+        else:
+            self.accept_encoding = compression
+
+    def timeout(self, endpoint: str) -> tuple[float, float]:
+        '''Returns the (connect, read) timeout for the given endpoint class.'''
+        return self.timeouts.get(endpoint, self.timeouts['page'])
+
+    @abstractmethod
+    def get(self, url: str, endpoint: str = 'page', **kwargs: Any) -> Any:
+        '''Sends a GET request and returns the response.'''
+
+    @abstractmethod
+    def post(self, url: str, data: dict | None = None, endpoint: str = 'page', **kwargs: Any) -> Any:
+        '''Sends a POST request and returns the response.'''
+
+    @abstractmethod
+    def close(self) -> None:
+        '''Closes all pooled connections.'''
+
+
+class RequestsTransport(Transport):
+    '''
+    HTTP/1.1 transport backed by a `requests` session.
+    '''
+
+    exceptions = (requests.RequestException,)
+
+    def __init__(
+        self,
+        timeouts: dict[str, tuple[float, float]] | None = None,
+        compression: bool | str = True,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+    ) -> None:
+        '''
+        Initializes a RequestsTransport object.
+
+        Args:
+            timeouts (dict[str, tuple[float, float]] | None): See `Transport`. Defaults to None.
+            compression (bool | str): See `Transport`. Defaults to True.
+            pool_connections (int): The number of host pools to cache. Defaults to 10.
+            pool_maxsize (int): The maximum number of connections kept per host. Defaults to 10.
+            keep_alive (bool): Whether to reuse connections between requests. Defaults to True.
+        '''
+        super().__init__(timeouts, compression)
+        self.session = requests.session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers['Accept-Encoding'] = self.accept_encoding
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
+
+    def get(self, url: str, endpoint: str = 'page', **kwargs: Any) -> requests.Response:
+        kwargs.setdefault('timeout', self.timeout(endpoint))
+        return self.session.get(url, **kwargs)
+
+    def post(self, url: str, data: dict | None = None, endpoint: str = 'page', **kwargs: Any) -> requests.Response:
+        kwargs.setdefault('timeout', self.timeout(endpoint))
+        return self.session.post(url, data=data, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class HTTPXTransport(Transport):
+    '''
+    HTTP/2 transport backed by an `httpx` client.
+
+    Concurrent requests from several threads (e.g. `Gradescope.prefetch`) are multiplexed over a
+    single connection. Requires the optional dependency: `pip install gradescope-tool[http2]`.
+    '''
+
+    def __init__(
+        self,
+        timeouts: dict[str, tuple[float, float]] | None = None,
+        compression: bool | str = True,
+        http2: bool = True,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+    ) -> None:
+        '''
+        Initializes a HTTPXTransport object.
+
+        Args:
+            timeouts (dict[str, tuple[float, float]] | None): See `Transport`. Defaults to None.
+            compression (bool | str): See `Transport`. Defaults to True.
+            http2 (bool): Whether to negotiate HTTP/2. Defaults to True.
+            max_connections (int): The maximum number of open connections. Defaults to 10.
+            max_keepalive_connections (int): The maximum number of idle connections kept alive. Defaults to 10.
+            keepalive_expiry (float): Seconds an idle connection is kept alive. Defaults to 30.0.
+
+        Raises:
+            ImportError: If httpx (or h2, when `http2` is True) is not installed.
+        '''
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError('HTTPXTransport requires httpx: pip install gradescope-tool[http2]') from e
+
+        super().__init__(timeouts, compression)
+        self._httpx = httpx
+        self.exceptions = (httpx.HTTPError,)
+        self.session = httpx.Client(
+            http2=http2,
+            follow_redirects=True,
+            headers={'Accept-Encoding': self.accept_encoding},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+
+    def _timeout(self, endpoint: str):
+        connect, read = self.timeout(endpoint)
+        return self._httpx.Timeout(read, connect=connect)
+
+    def get(self, url: str, endpoint: str = 'page', **kwargs: Any) -> Any:
+        kwargs.setdefault('timeout', self._timeout(endpoint))
+        return self.session.get(url, **kwargs)
+
+    def post(self, url: str, data: dict | None = None, endpoint: str = 'page', **kwargs: Any) -> Any:
+        kwargs.setdefault('timeout', self._timeout(endpoint))
+        return self.session.post(url, data=data, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
@@ -2,7 +2,18 @@
 
 import json
 import dataclasses
+import numpy as np
 import pandas as pd
+from datetime import tzinfo
+from dateutil.tz import tzlocal
+from urllib.parse import urljoin
+from .constants import BASE_URL, PAST_SUBMISSIONS
+from .dataclass import Assignment
+
+
+ASSIGNMENT_DATE_COLUMNS = ['release_date', 'due_date', 'hard_due_date', 'due_or_created_at_date']
+ASSIGNMENT_INT_COLUMNS = ['assignment_id', 'active_submissions', 'grading_progress', 'regrade_request_count']
+ASSIGNMENT_BOOL_COLUMNS = ['versioned', 'published', 'regrade_requests_open', 'regrade_requests_possible']
 
 
 class EnhancedJSONEncoder(json.JSONEncoder):
@@ -73,3 +84,108 @@ def save_csv(path: str, dataframe: pd.DataFrame, index: bool = False) -> None:
         None
     '''
     dataframe.to_csv(path, index=index)
+
+
+def to_utc(values: pd.Series, tz: str | tzinfo | None = None) -> pd.Series:
+    '''
+    Parse ISO 8601 date strings into timezone-aware (UTC) datetimes.
+
+    Values with a UTC offset are converted directly. Values without one are local times in `tz`
+    and are localized before converting; times skipped by a DST change are shifted forward and
+    repeated times are taken as the first (DST) occurrence. Unparsable values become NaT.
+
+    Args:
+        values: The strings to parse.
+        tz: The time zone of values without an offset, e.g. 'America/Los_Angeles' (default is the local time zone).
+
+    Returns:
+        The parsed datetimes as a Series with the same index.
+    '''
+    values = pd.Series(values, dtype='string')
+    aware = values.str.contains(r'(?:Z|[+-]\d{2}:?\d{2})$', regex=True).fillna(False).to_numpy(dtype=bool)
+
+    result = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns, UTC]')
+    if aware.any():
+        result[aware] = pd.to_datetime(values[aware], utc=True, errors='coerce', format='ISO8601')
+    if (~aware).any():
+        naive = pd.to_datetime(values[~aware], errors='coerce', format='ISO8601')
+        result[~aware] = naive.dt.tz_localize(
+            tzlocal() if tz is None else tz,
+            ambiguous=np.ones(len(naive), dtype=bool),
+            nonexistent='shift_forward',
+        ).dt.tz_convert('UTC')
+    return result
+
+
+def _parse_created_at(values: pd.Series, reference: pd.Series, tz: str | tzinfo | None) -> pd.Series:
+    '''
+    Parses `created_at` values, which are ISO 8601 or day-only ('Apr 01') strings.
+
+    Day-only values take their year from `reference` (the year before if that would put them after it)
+    and are taken as midnight in `tz`.
+    '''
+    result = to_utc(values, tz)
+    short = result.isna() & values.notna() & reference.notna()
+    if short.any():
+        reference = reference[short].dt.tz_convert(tzlocal() if tz is None else tz)
+        year = reference.dt.year
+        text = values[short].astype('string') + ' '
+        dates = pd.to_datetime(text + year.astype('string'), format='%b %d %Y', errors='coerce')
+        previous = pd.to_datetime(text + (year - 1).astype('string'), format='%b %d %Y', errors='coerce')
+        dates = dates.where(dates <= reference.dt.tz_localize(None), previous)
+        result[short] = to_utc(dates.dt.strftime('%Y-%m-%dT%H:%M:%S'), tz)
+    return result
+
+
+def assignments_to_dataframe(assignments: list[Assignment], tz: str | tzinfo | None = None) -> pd.DataFrame:
+    '''
+    Convert a list of assignments into a typed DataFrame.
+
+    The assignments may come from any number of courses; the course ID is recovered from each
+    assignment URL. Date columns are parsed in one vectorized step into timezone-aware (UTC)
+    datetimes (see `to_utc`). Gradescope gives assignment dates without an offset, in the time
+    zone of the course, so pass that zone as `tz` when it is not the local time zone.
+
+    `created_at` is only given as a day ('Apr 01'); it is taken as midnight in `tz`, with the year
+    of the release date (or due date). `total_points` is converted to a float.
+
+    Args:
+        assignments: The assignments to convert.
+        tz: The time zone of the course, e.g. 'America/Los_Angeles' (default is the local time zone).
+
+    Returns:
+        The assignments as a pandas DataFrame with one row per assignment.
+    '''
+    names = [field.name for field in dataclasses.fields(Assignment)]
+    df = pd.DataFrame({name: [getattr(a, name) for a in assignments] for name in names})
+
+    df.insert(0, 'course_id', pd.to_numeric(df['url'].astype('string').str.extract(r'/courses/(\d+)', expand=False)).astype('Int64'))
+    for column in ASSIGNMENT_INT_COLUMNS:
+        df[column] = pd.to_numeric(df[column], errors='coerce').astype('Int64')
+    for column in ASSIGNMENT_BOOL_COLUMNS:
+        df[column] = df[column].astype('boolean')
+    for column in ASSIGNMENT_DATE_COLUMNS:
+        df[column] = to_utc(df[column], tz)
+    reference = df['release_date'].fillna(df['due_or_created_at_date']).fillna(df['due_date'])
+    df['created_at'] = _parse_created_at(df['created_at'], reference, tz)
+    df['total_points'] = pd.to_numeric(df['total_points'], errors='coerce').astype('float64')
+    return df
+
+
+def past_submissions_urls(gradebook: list[dict]) -> dict[int, str]:
+    '''
+    Find the past submissions URL of every assignment a member has submitted to.
+
+    Args:
+        gradebook: The member's gradebook, as returned by `Gradescope.get_gradebook`.
+
+    Returns:
+        The past submissions JSON URL per assignment ID, for assignments with a submission.
+    '''
+    urls = dict()
+    for item in gradebook:
+        item_data = item.get('assignment') or {}
+        url = (item_data.get('submission') or {}).get('url')
+        if url:
+            urls[item_data.get('id')] = urljoin(BASE_URL, url + PAST_SUBMISSIONS)
+    return urls
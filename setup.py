@@ -25,5 +25,12 @@ setuptools.setup(
         'Operating System :: OS Independent',
     ],
     python_requires='>=3.7',
-    install_requires=REQUIREMENTS
+    install_requires=REQUIREMENTS,
+    entry_points={
+        'console_scripts': ['gradescope=gradescope.cli:main'],
+    },
+    extras_require={
+        'http2': ['httpx[http2]', 'brotli'],
+        'snapshot': ['pyarrow'],
+    }
 )
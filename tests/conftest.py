@@ -0,0 +1,42 @@
+import pytest
+from gradescope import Gradescope
+from gradescope.transport import Transport
+
+
+class FakeResponse:
+    def __init__(self, url, text, status_code=200):
+        self.url = url
+        self.text = text
+        self.content = text.encode('utf-8')
+        self.status_code = status_code
+
+
+class FakeTransport(Transport):
+    '''Serves canned responses by URL; unknown URLs return 404.'''
+
+    def __init__(self, routes):
+        super().__init__()
+        self.routes = routes
+        self.session = None
+        self.requests = []
+
+    def get(self, url, endpoint='page', **kwargs):
+        self.requests.append(url)
+        if url in self.routes:
+            return FakeResponse(url, self.routes[url])
+        return FakeResponse(url, '', 404)
+
+    def post(self, url, data=None, endpoint='page', **kwargs):
+        return self.get(url, endpoint)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def make_client():
+    def make(routes):
+        gs = Gradescope(transport=FakeTransport(routes))
+        gs.logged_in = True
+        return gs
+    return make
@@ -0,0 +1,57 @@
+import pandas as pd
+from gradescope import Submission
+from gradescope.analytics import (
+    add_lateness, assignment_summary, collect_submissions, score_progression, student_summary,
+    submissions_to_dataframe,
+)
+from test_utils import make_assignment
+
+
+def make_submissions():
+    return submissions_to_dataframe([
+        Submission(1, 10, 500, 1, '2024-04-07T12:00:00-07:00', 5.0, '/s/1'),
+        Submission(1, 10, 500, 2, '2024-04-07T18:00:00-07:00', 8.0, '/s/2'),
+        Submission(1, 10, 500, 3, '2024-04-07T20:00:00-07:00', None, '/s/3'),
+        Submission(1, 10, 600, 4, '2024-04-08T01:00:00-07:00', 9.0, '/s/4'),
+    ])
+
+
+def test_progression_uses_actual_last_submission():
+    progression = score_progression(make_submissions())
+    row = progression.loc[(10, '500')]
+    assert row['attempts'] == 3
+    assert row['first_score'] == 5.0
+    assert pd.isna(row['final_score'])
+    assert pd.isna(row['improvement'])
+    assert row['best_score'] == 8.0
+    assert progression.loc[(10, '600'), 'final_score'] == 9.0
+
+
+def test_lateness_uses_course_time_zone():
+    assignments = [make_assignment(10, 'Apr 01', '2024-04-01T00:00', '2024-04-07T23:59', '2024-04-10T23:59')]
+    df = add_lateness(make_submissions(), assignments, tz='America/Los_Angeles')
+
+    on_time = df[df['submission_id'] == 3].iloc[0]
+    assert not on_time['late']
+    assert round(on_time['hours_to_deadline'], 2) == 3.98
+    late = df[df['submission_id'] == 4].iloc[0]
+    assert late['late'] and not late['after_hard_deadline']
+
+    assert student_summary(df).loc['600', 'late_submissions'] == 1
+    assert assignment_summary(df).loc[10, 'late_students'] == 0.5
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = []
+
+    def get_member_submissions(self, course, member, assignments=None):
+        self.calls.append((member, assignments))
+        return [Submission(1, 10, member, member * 10, '2024-04-07T12:00:00-07:00', 1.0, '/s')]
+
+
+def test_collect_submissions_fetches_each_member_history():
+    client = FakeClient()
+    df = collect_submissions(client, None, members=[1, 2], max_workers=2)
+    assert sorted(df['submission_id']) == [10, 20]
+    assert sorted(member for member, _ in client.calls) == [1, 2]
@@ -0,0 +1,32 @@
+import requests
+from gradescope import cli
+from gradescope.transport import RequestsTransport
+
+
+def test_connection_error_exits_with_message(monkeypatch, capsys):
+    def fail(self, url, endpoint='page', **kwargs):
+        raise requests.ConnectTimeout(f'Timed out connecting to {url}')
+
+    monkeypatch.setattr(RequestsTransport, 'get', fail)
+    assert cli.main(['-u', 'user', '-p', 'password', 'export', '1']) == 1
+    assert 'Timed out connecting to https://www.gradescope.com' in capsys.readouterr().err
+
+
+def test_export_errors_exit_non_zero(monkeypatch, tmp_path, capsys):
+    class Stats:
+        errors = 2
+
+        def report(self):
+            return 'report'
+
+    class Client:
+        logged_in = True
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+    monkeypatch.setattr(cli, 'Gradescope', Client)
+    monkeypatch.setattr(cli, '_find_course', lambda gs, course_id: type('Course', (), {'short_name': 'CS 1'})())
+    monkeypatch.setattr(cli, 'export_course', lambda *args, **kwargs: Stats())
+    assert cli.main(['-u', 'user', '-p', 'password', 'export', '1', '-o', str(tmp_path)]) == 1
+    assert 'Export finished with 2 errors' in capsys.readouterr().err
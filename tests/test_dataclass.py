@@ -0,0 +1,57 @@
+import copy
+import pickle
+import pytest
+from gradescope import Course, Member, Role
+from gradescope.errors import NotBoundError
+
+
+class FakeClient:
+    def __init__(self):
+        self.password = 'hunter2'
+        self.calls = 0
+
+    def get_members(self, course):
+        self.calls += 1
+        return [Member(1, 'Peter Anteater', 'Peter', 'Anteater', '0', '123', 'peter@uci.edu')._bind(self, course=course)]
+
+
+def make_course():
+    return Course(123456, '/courses/123456', Role.INSTRUCTOR, 'Spring 2024', 'CS 1', 'Intro')
+
+
+def test_related_data_is_loaded_once():
+    client = FakeClient()
+    course = make_course()._bind(client)
+    assert course.members is course.members
+    assert client.calls == 1
+    assert course.members[0].course is course
+    course.invalidate('members')
+    course.members
+    assert client.calls == 2
+
+
+def test_unbound_object_raises():
+    with pytest.raises(NotBoundError):
+        make_course().members
+
+
+def test_pickle_drops_client_and_cache():
+    course = make_course()._bind(FakeClient())
+    course.members
+    data = pickle.dumps(course)
+    assert b'hunter2' not in data
+
+    restored = pickle.loads(data)
+    assert restored == course
+    assert not restored.is_loaded('members')
+    with pytest.raises(NotBoundError):
+        restored.members
+
+
+def test_deepcopy_does_not_clone_client():
+    client = FakeClient()
+    member = client.get_members(make_course()._bind(client))[0]
+    clone = copy.deepcopy(member)
+    assert clone == member
+    assert clone.course is None
+    assert '_client' not in vars(clone)
@@ -0,0 +1,102 @@
+import io
+import numpy as np
+import pandas as pd
+import pytest
+from gradescope.diff import FALLBACK_KEY, GradeTracker, diff_grades
+
+
+def grades(rows):
+    return pd.DataFrame(rows, columns=['Name', 'SID', 'Email', 'Total Score'])
+
+
+def from_csv(frame):
+    '''Round-trips through CSV like a real scores.csv download (blank SIDs become NaN).'''
+    return pd.read_csv(io.StringIO(frame.to_csv(index=False)))
+
+
+def test_changed_added_and_removed_by_sid():
+    old = grades([['A', 1, 'a@uci.edu', 5.0], ['B', 2, 'b@uci.edu', 7.0]])
+    new = grades([['A', 1, 'a@uci.edu', 9.0], ['C', 3, 'c@uci.edu', 4.0]])
+    changes = diff_grades(old, new)
+
+    assert changes.key == 'SID'
+    assert list(changes.added.index) == [3]
+    assert list(changes.removed.index) == [2]
+    assert changes.changed.to_dict('records') == [{'SID': 1, 'column': 'Total Score', 'old': 5.0, 'new': 9.0}]
+    assert list(changes.updated.index) == [3, 1]
+
+
+def test_unchanged_grades_are_empty():
+    old = grades([['A', 1, 'a@uci.edu', 5.0], ['B', 2, 'b@uci.edu', np.nan]])
+    assert diff_grades(old, old.copy()).is_empty
+
+
+def test_empty_sid_column_falls_back_to_email():
+    old = from_csv(grades([['A', None, 'a@uci.edu', 5.0], ['B', None, 'b@uci.edu', 7.0]]))
+    new = from_csv(grades([['A', None, 'a@uci.edu', 9.0], ['B', None, 'b@uci.edu', 7.0]]))
+    changes = diff_grades(old, new)
+
+    assert not changes.is_empty
+    assert changes.key == FALLBACK_KEY
+    assert changes.changed.to_dict('records') == [
+        {FALLBACK_KEY: 'a@uci.edu', 'column': 'Total Score', 'old': 5.0, 'new': 9.0}
+    ]
+
+
+def test_mixed_roster_keeps_students_without_sid():
+    old = grades([['A', 1, 'a@uci.edu', 5.0], ['B', 2, 'b@uci.edu', 7.0], ['C', None, 'c@uci.edu', 1.0]])
+    new = grades([['A', 1, 'a@uci.edu', 5.0], ['B', 2, 'b@uci.edu', 8.0], ['C', None, 'c@uci.edu', 2.0]])
+    changes = diff_grades(from_csv(old), from_csv(new))
+
+    assert changes.key == FALLBACK_KEY
+    assert sorted(changes.changed[FALLBACK_KEY]) == ['2', 'c@uci.edu']
+    assert changes.added.empty and changes.removed.empty
+
+
+def test_mixed_roster_matches_snapshot_without_blanks():
+    old = from_csv(grades([['A', 1, 'a@uci.edu', 5.0], ['B', 2, 'b@uci.edu', 7.0]]))
+    new = from_csv(grades([['A', 1, 'a@uci.edu', 6.0], ['B', 2, 'b@uci.edu', 7.0], ['C', None, 'c@uci.edu', 1.0]]))
+    changes = diff_grades(old, new)
+
+    assert list(changes.added.index) == ['c@uci.edu']
+    assert changes.removed.empty
+    assert list(changes.changed[FALLBACK_KEY]) == ['1']
+
+
+def test_explicit_key_with_missing_values_raises():
+    new = grades([['A', 1, 'a@uci.edu', 5.0], ['B', None, None, 7.0]])
+    with pytest.raises(ValueError, match='1 rows have no Email'):
+        diff_grades(None, new, key='Email')
+
+
+def test_missing_key_columns_raise():
+    with pytest.raises(KeyError):
+        diff_grades(None, pd.DataFrame({'Name': ['A'], 'Total Score': [1.0]}))
+
+
+def test_tracker_reports_only_new_changes():
+    tracker = GradeTracker()
+    assignment = type('Assignment', (), {'assignment_id': 1})()
+    first = grades([['A', 1, 'a@uci.edu', 5.0]])
+    assert list(tracker.update(assignment, first).added.index) == [1]
+    assert tracker.update(assignment, first.copy()).is_empty
+    assert len(tracker.update(assignment, grades([['A', 1, 'a@uci.edu', 6.0]])).changed) == 1
+
+
+def test_activity_columns_are_ignored_by_default():
+    old = grades([['A', 1, 'a@uci.edu', 5.0]]).assign(**{'View Count': 1, 'Submission Time': '2024-04-07 12:00:00 -0700'})
+    new = old.assign(**{'View Count': 4})
+    assert diff_grades(old, new).is_empty
+
+    changes = diff_grades(old, new, columns=['Total Score', 'View Count'])
+    assert changes.changed.to_dict('records') == [{'SID': 1, 'column': 'View Count', 'old': 1, 'new': 4}]
+
+
+def test_tracker_keeps_its_own_copy():
+    tracker = GradeTracker()
+    assignment = type('Assignment', (), {'assignment_id': 1})()
+    current = grades([['A', 1, 'a@uci.edu', 5.0]])
+    tracker.update(assignment, current)
+    current.loc[0, 'Total Score'] = 9.0
+    changes = tracker.update(assignment, current)
+    assert changes.changed.to_dict('records') == [{'SID': 1, 'column': 'Total Score', 'old': 5.0, 'new': 9.0}]
@@ -0,0 +1,63 @@
+import json
+import os
+from gradescope import Course, Role
+from gradescope.export import export_course
+
+ROSTER = '''
+<table>
+  <tr>
+    <td><button class="js-rosterName" data-url="/courses/1/gradebook?user_id=5">Peter</button></td>
+    <td><button class="rosterCell--editIcon" data-role="0" data-email="peter@uci.edu"
+        data-cm='{"full_name": "Peter Anteater", "first_name": "Peter", "last_name": "Anteater", "sid": "123"}'></button></td>
+  </tr>
+</table>
+'''
+
+
+def test_failed_fetch_is_reported_and_not_written(make_client, tmp_path):
+    gs = make_client({
+        'https://www.gradescope.com/courses/1/memberships': ROSTER,
+        'https://www.gradescope.com/courses/1/gradebook.json?user_id=5': '[]',
+    })
+    course = Course(1, '/courses/1', Role.INSTRUCTOR, 'Spring 2024', 'CS 1', 'Intro')
+    stats = export_course(gs, course, str(tmp_path), fetch_workers=2, parse_workers=1)
+
+    assert stats.errors == 1
+    assert stats.failed == {'assignments': 1}
+    assert 'Failed: assignments (1)' in stats.report()
+    assert not os.path.exists(tmp_path / 'assignments.json')
+    with open(tmp_path / 'members.json') as file:
+        assert [m['member_id'] for m in json.load(file)] == ['5']
+
+
+def test_history_fans_out_into_one_fetch_per_request(make_client, tmp_path):
+    base = 'https://www.gradescope.com/courses/1'
+    table = {'table_data': [{'id': '11', 'type': 'assignment', 'url': '/courses/1/assignments/11', 'title': 'HW 1'}]}
+    gradebook = [
+        {'assignment': {'id': 11, 'submission': {'url': '/courses/1/assignments/11/submissions/100'}}},
+        {'assignment': {'id': 12, 'submission': None}},
+    ]
+    history = {'past_submissions': [
+        {'id': 100, 'created_at': '2024-11-03T01:30:00-07:00', 'score': '5', 'show_path': '/courses/1/assignments/11/submissions/100'},
+        # Later, although its local time is earlier (after the DST fall-back)
+        {'id': 101, 'created_at': '2024-11-03T01:10:00-08:00', 'score': '8', 'show_path': '/courses/1/assignments/11/submissions/101'},
+    ]}
+    gs = make_client({
+        f'{base}/assignments': f"<div data-react-class='AssignmentsTable' data-react-props='{json.dumps(table)}'></div>",
+        f'{base}/memberships': ROSTER,
+        f'{base}/assignments/11/scores.csv': 'x\ny\nName,SID,Email,Total Score\nPeter,123,peter@uci.edu,8\n',
+        f'{base}/gradebook.json?user_id=5': json.dumps(gradebook),
+        f'{base}/assignments/11/submissions/100.json?content=react&only_keys%5B%5D=past_submissions': json.dumps(history),
+        f'{base}/assignments/11/submissions/101.zip': 'zip',
+    })
+    course = Course(1, '/courses/1', Role.INSTRUCTOR, 'Spring 2024', 'CS 1', 'Intro')
+    stats = export_course(gs, course, str(tmp_path), files=True, fetch_workers=2, parse_workers=1)
+
+    fetch, parse, write = stats.stages
+    assert stats.errors == 0
+    assert fetch.items == len(gs.transport.requests) == 6
+    assert fetch.bytes == sum(len(gs.transport.routes[url]) for url in gs.transport.requests)
+    assert parse.items == 6
+    assert os.path.exists(tmp_path / 'files' / '11' / '5' / '101.zip')
+    with open(tmp_path / 'submissions.json') as file:
+        assert sorted(s['submission_id'] for s in json.load(file)) == [100, 101]
@@ -0,0 +1,61 @@
+import logging
+from gradescope import Course, Role
+
+STUDENT_PAGE = '''
+<table id="assignments-student-table"><tbody>
+  <tr>
+    <th class="table--primaryLink"><button data-assignment-id="11" data-post-url="/courses/1/assignments/11/submissions">HW 1</button></th>
+    <td class="submissionStatus submissionStatus-complete"><div class="submissionStatus--score">8.0 / 10.0</div></td>
+    <td>
+      <time class="submissionTimeChart--releaseDate" datetime="2024-04-01 00:00:00 -0700"></time>
+      <time class="submissionTimeChart--dueDate" datetime="2024-04-07 23:59:00 -0700"></time>
+    </td>
+  </tr>
+</tbody></table>
+'''
+
+
+def make_course(course_id):
+    return Course(course_id, f'/courses/{course_id}', Role.STUDENT, 'Spring 2024', f'CS {course_id}', 'Intro')
+
+
+def test_dashboard_skips_failing_courses(make_client, caplog):
+    gs = make_client({
+        'https://www.gradescope.com/courses/1': STUDENT_PAGE,
+        'https://www.gradescope.com/courses/2': '<html>instructor view</html>',
+    })
+    with caplog.at_level(logging.WARNING):
+        dashboard = gs.get_student_dashboard([make_course(1), make_course(2), make_course(3)])
+
+    assert list(dashboard['title']) == ['HW 1']
+    assert dashboard.loc[0, 'points'] == 8.0
+    assert str(dashboard.loc[0, 'due_date']) == '2024-04-08 06:59:00+00:00'
+    assert 'Skipping course ID 2' in caplog.text
+    assert 'Skipping course ID 3' in caplog.text
+
+
+def test_member_submissions_use_one_gradebook_request(make_client):
+    gradebook = '''[
+        {"assignment": {"id": 11, "submission": {"url": "/courses/1/assignments/11/submissions/100"}}},
+        {"assignment": {"id": 12, "submission": null}},
+        {"assignment": {"id": 13, "submission": {"url": "/courses/1/assignments/13/submissions/300"}}}
+    ]'''
+    history = '{"past_submissions": [{"id": %d, "created_at": "2024-04-07T12:00:00-07:00", "score": "%s", "show_path": "/s"}]}'
+    gs = make_client({
+        'https://www.gradescope.com/courses/1/gradebook.json?user_id=5': gradebook,
+        'https://www.gradescope.com/courses/1/assignments/11/submissions/100'
+        '.json?content=react&only_keys%5B%5D=past_submissions': history % (100, '7.5'),
+        'https://www.gradescope.com/courses/1/assignments/13/submissions/300'
+        '.json?content=react&only_keys%5B%5D=past_submissions': history % (300, ''),
+    })
+    course = make_course(1)
+    member = type('Member', (), {'member_id': 5})()
+
+    submissions = gs.get_member_submissions(course, member)
+    assert [(s.assignment_id, s.submission_id, s.score) for s in submissions] == [(11, 100, 7.5), (13, 300, None)]
+    assert sum('gradebook' in url for url in gs.transport.requests) == 1
+
+    only = type('Assignment', (), {'assignment_id': 13})()
+    assert [s.submission_id for s in gs.get_member_submissions(course, member, [only])] == [300]
+    assert gs.get_past_submissions(course, only, member)[0].submission_id == 300
+    assert gs.get_past_submissions(course, type('Assignment', (), {'assignment_id': 12})(), member) is None
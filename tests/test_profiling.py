@@ -0,0 +1,70 @@
+import threading
+import pytest
+from gradescope import Course, Role
+from gradescope.profiling import Profiler
+from test_export import ROSTER
+
+
+@pytest.fixture
+def profiler():
+    profiler = Profiler()
+    profiler.start()
+    yield profiler
+    profiler.stop()
+
+
+def test_collapsed_bytes_are_exclusive(profiler):
+    with profiler.phase('outer'):
+        outer = bytearray(200_000)
+        with profiler.phase('inner'):
+            inner = bytearray(1_000_000)
+    del outer, inner
+
+    df = profiler.to_dataframe().set_index('path')
+    assert df.loc['outer', 'net_bytes'] >= 1_200_000
+    assert 150_000 <= df.loc['outer', 'self_net_bytes'] < 1_000_000
+    lines = dict(line.rsplit(' ', 1) for line in profiler.collapsed('self_net_bytes').splitlines())
+    assert int(lines['outer']) + int(lines['outer;inner']) == df.loc['outer', 'net_bytes']
+
+
+def test_collapsed_rejects_inclusive_metric(profiler):
+    with pytest.raises(ValueError):
+        profiler.collapsed('net_bytes')
+
+
+def test_peak_is_not_recorded_for_overlapping_phases(profiler):
+    with profiler.phase('alone'):
+        data = bytearray(500_000)
+    del data
+
+    started, release = threading.Event(), threading.Event()
+
+    def worker():
+        with profiler.phase('worker'):
+            started.set()
+            release.wait()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    started.wait()
+    with profiler.phase('main'):
+        data = bytearray(500_000)
+    release.set()
+    thread.join()
+
+    df = profiler.to_dataframe().set_index('path')
+    assert df.loc['alone', 'peak_bytes'] >= 500_000
+    assert df[['peak_bytes']].loc[['main', 'worker']].isna().all().all()
+    assert '-' in profiler.report()
+
+
+def test_model_phase_is_entered_once_per_call(make_client):
+    row = ROSTER[ROSTER.index('<tr>'):ROSTER.index('</tr>') + 5]
+    gs = make_client({'https://www.gradescope.com/courses/1/memberships': f'<table>{row * 300}</table>'})
+    gs.enable_profiling()
+    try:
+        assert len(gs.get_members(Course(1, '/courses/1', Role.INSTRUCTOR, '', '', ''))) == 300
+        stats = gs.profiler.stats[('Gradescope.get_members', 'parse', 'model')]
+        assert stats.calls == 1
+    finally:
+        gs.disable_profiling()
@@ -0,0 +1,86 @@
+import logging
+import pytest
+from gradescope import Course, Member, Role, Submission
+
+pytest.importorskip('pyarrow')
+from gradescope.snapshot import save_snapshot, load_snapshot  # noqa: E402
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = 0
+
+    def get_members(self, course):
+        self.calls += 1
+        return [Member(2, 'Zot Zot', 'Zot', 'Zot', '0', '456', 'zot@uci.edu')._bind(self, course=course)]
+
+    def get_assignments(self, course):
+        self.calls += 1
+        return []
+
+
+def make_course(course_id):
+    return Course(course_id, f'/courses/{course_id}', Role.INSTRUCTOR, 'Spring 2024', f'CS {course_id}', 'Intro')
+
+
+def test_loaded_data_round_trips(tmp_path):
+    course = make_course(1)
+    course.__dict__['_cache'] = {
+        'assignments': [],
+        'members': [Member(1, 'Peter Anteater', 'Peter', 'Anteater', '0', '123', 'peter@uci.edu')],
+    }
+    save_snapshot(str(tmp_path), [course])
+
+    loaded = load_snapshot(str(tmp_path)).courses[0]
+    assert loaded == course
+    assert loaded.is_loaded('assignments') and loaded.is_loaded('members')
+    assert [m.full_name for m in loaded.members] == ['Peter Anteater']
+    assert loaded.members[0].course is loaded
+
+
+def test_missing_data_is_fetched_after_load(tmp_path, caplog):
+    with caplog.at_level(logging.WARNING):
+        save_snapshot(str(tmp_path), [make_course(9)])
+    assert 'Course 9 has no members loaded' in caplog.text
+
+    client = FakeClient()
+    loaded = load_snapshot(str(tmp_path), client=client).courses[0]
+    assert not loaded.is_loaded('members')
+    assert [m.member_id for m in loaded.members] == [2]
+    assert client.calls == 1
+
+
+def test_mixed_type_column_warns(tmp_path, caplog):
+    submissions = [
+        Submission(1, 10, 1, 100, '2024-04-07T12:00:00-07:00', 5.0, '/s/100'),
+        Submission(1, 10, '2', 101, '2024-04-07T13:00:00-07:00', 7.0, '/s/101'),
+    ]
+    with caplog.at_level(logging.WARNING):
+        save_snapshot(str(tmp_path), [], submissions=submissions)
+    assert 'member_id has mixed types' in caplog.text
+    assert len(load_snapshot(str(tmp_path)).get_submissions(member_id=2)) == 1
+
+
+
+def rewrite_metadata(path, metadata):
+    import pyarrow as pa
+
+    # Read into memory first: a memory-mapped table would change under the rewrite
+    with open(path, 'rb') as file:
+        table = pa.ipc.open_file(pa.py_buffer(file.read())).read_all()
+    table = table.replace_schema_metadata(metadata)
+    with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def test_unknown_version_is_rejected(tmp_path):
+    save_snapshot(str(tmp_path), [])
+    rewrite_metadata(str(tmp_path / 'members.arrow'), {'gradescope.snapshot.version': '99'})
+    with pytest.raises(ValueError, match='members.arrow has snapshot format version 99'):
+        load_snapshot(str(tmp_path))
+
+
+def test_missing_version_is_read_as_version_1(tmp_path):
+    save_snapshot(str(tmp_path), [make_course(1)])
+    rewrite_metadata(str(tmp_path / 'courses.arrow'), None)
+    assert load_snapshot(str(tmp_path)).courses[0].course_id == 1
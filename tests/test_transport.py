@@ -0,0 +1,123 @@
+import pytest
+from gradescope import transport as transport_module
+from gradescope.transport import DEFAULT_TIMEOUTS, Transport, RequestsTransport, HTTPXTransport
+
+
+def test_incomplete_backend_fails_on_creation():
+    class GetOnly(Transport):
+        def get(self, url, endpoint='page', **kwargs):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnly()
+
+
+def test_timeouts_are_merged_per_endpoint():
+    transport = RequestsTransport(timeouts={'csv': (1.0, 2.0)})
+    try:
+        assert transport.timeout('csv') == (1.0, 2.0)
+        assert transport.timeout('download') == DEFAULT_TIMEOUTS['download']
+        assert transport.timeout('unknown') == DEFAULT_TIMEOUTS['page']
+    finally:
+        transport.close()
+
+
+@pytest.mark.parametrize('compression, brotli, expected', [
+    (True, False, 'gzip, deflate'),
+    (True, True, 'gzip, deflate, br'),
+    (False, True, 'identity'),
+    ('gzip', True, 'gzip'),
+])
+def test_accept_encoding_negotiation(monkeypatch, compression, brotli, expected):
+    monkeypatch.setattr(transport_module, '_brotli_available', lambda: brotli)
+    transport = RequestsTransport(compression=compression)
+    try:
+        assert transport.accept_encoding == expected
+        assert transport.session.headers['Accept-Encoding'] == expected
+    finally:
+        transport.close()
+
+
+def test_requests_session_pools_and_keep_alive():
+    transport = RequestsTransport(pool_connections=3, pool_maxsize=7, keep_alive=False)
+    try:
+        adapter = transport.session.get_adapter('https://www.gradescope.com')
+        assert (adapter._pool_connections, adapter._pool_maxsize) == (3, 7)
+        assert transport.session.headers['Connection'] == 'close'
+    finally:
+        transport.close()
+    transport = RequestsTransport()
+    try:
+        assert transport.session.headers['Connection'] == 'keep-alive'
+    finally:
+        transport.close()
+
+
+def test_requests_timeout_per_endpoint(monkeypatch):
+    transport = RequestsTransport(timeouts={'csv': (1.0, 2.0)})
+    calls = []
+    monkeypatch.setattr(transport.session, 'get', lambda url, **kwargs: calls.append(kwargs))
+    monkeypatch.setattr(transport.session, 'post', lambda url, data=None, **kwargs: calls.append(kwargs))
+    transport.get('https://www.gradescope.com', endpoint='csv')
+    transport.get('https://www.gradescope.com', endpoint='csv', timeout=9)
+    transport.post('https://www.gradescope.com/login', data={})
+    assert [c['timeout'] for c in calls] == [(1.0, 2.0), 9, DEFAULT_TIMEOUTS['page']]
+    transport.close()
+
+
+@pytest.fixture
+def mock_httpx(monkeypatch):
+    '''Routes every HTTPXTransport request to a handler and records the client options.'''
+    httpx = pytest.importorskip('httpx')
+    seen = {'requests': [], 'options': None}
+    real_client = httpx.Client
+
+    def handler(request):
+        seen['requests'].append(request)
+        if request.url.path == '/redirect':
+            return httpx.Response(302, headers={'Location': '/done'})
+        return httpx.Response(200, text='ok')
+
+    def client(**options):
+        seen['options'] = options
+        return real_client(transport=httpx.MockTransport(handler), **options)
+
+    monkeypatch.setattr(httpx, 'Client', client)
+    return seen
+
+
+def test_httpx_client_options(mock_httpx, monkeypatch):
+    monkeypatch.setattr(transport_module, '_brotli_available', lambda: False)
+    transport = HTTPXTransport(http2=False, max_connections=4, max_keepalive_connections=2, keepalive_expiry=5.0)
+    options = mock_httpx['options']
+    assert options['http2'] is False
+    assert options['follow_redirects'] is True
+    assert options['headers'] == {'Accept-Encoding': 'gzip, deflate'}
+    limits = options['limits']
+    assert (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry) == (4, 2, 5.0)
+    transport.close()
+
+
+def test_httpx_timeouts_and_redirects(mock_httpx):
+    transport = HTTPXTransport(http2=False, timeouts={'download': (2.0, 60.0)})
+    response = transport.get('https://www.gradescope.com/redirect', endpoint='download')
+    assert response.status_code == 200
+    assert str(response.url) == 'https://www.gradescope.com/done'
+    timeout = mock_httpx['requests'][0].extensions['timeout']
+    assert (timeout['connect'], timeout['read']) == (2.0, 60.0)
+
+    transport.post('https://www.gradescope.com/login', data={'a': '1'})
+    timeout = mock_httpx['requests'][-1].extensions['timeout']
+    assert (timeout['connect'], timeout['read']) == DEFAULT_TIMEOUTS['page']
+    assert mock_httpx['requests'][-1].content == b'a=1'
+    transport.close()
+
+
+def test_httpx_http2():
+    pytest.importorskip('httpx')
+    pytest.importorskip('h2')
+    transport = HTTPXTransport()
+    try:
+        assert transport.session._transport._pool._http2
+    finally:
+        transport.close()
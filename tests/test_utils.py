@@ -0,0 +1,59 @@
+import pandas as pd
+from gradescope import Assignment
+from gradescope.utils import assignments_to_dataframe, to_utc
+
+
+def make_assignment(assignment_id, created_at=None, release_date=None, due_date=None, hard_due_date=None):
+    return Assignment(
+        assignment_id=assignment_id,
+        assignment_type='assignment',
+        url=f'/courses/123456/assignments/{assignment_id}',
+        title=f'Assignment {assignment_id}',
+        container_id=None,
+        versioned=False,
+        version_index=None,
+        version_name=None,
+        total_points='100.0',
+        student_submission=True,
+        created_at=created_at,
+        release_date=release_date,
+        due_date=due_date,
+        hard_due_date=hard_due_date,
+        time_limit=None,
+        active_submissions=250,
+        grading_progress=100,
+        published=True,
+        regrade_requests_open=False,
+        regrade_requests_possible=True,
+        regrade_request_count=0,
+        due_or_created_at_date=due_date,
+    )
+
+
+def test_to_utc_localizes_naive_values():
+    result = to_utc(pd.Series(['2024-04-07T23:59', '2024-01-10T23:59']), 'America/Los_Angeles')
+    assert list(result) == [pd.Timestamp('2024-04-08T06:59Z'), pd.Timestamp('2024-01-11T07:59Z')]
+
+
+def test_to_utc_converts_values_with_offset():
+    result = to_utc(pd.Series(['2024-04-07T12:34:56-07:00', '2024-04-07T19:34:56Z', None, 'soon']), 'Asia/Tokyo')
+    assert list(result[:2]) == [pd.Timestamp('2024-04-07T19:34:56Z')] * 2
+    assert result[2:].isna().all()
+
+
+def test_assignment_dates_use_course_time_zone():
+    df = assignments_to_dataframe(
+        [make_assignment(1, 'Apr 01', '2024-04-01T00:00', '2024-04-07T23:59', '2024-04-10T23:59')],
+        tz='America/Los_Angeles',
+    )
+    row = df.iloc[0]
+    assert row['course_id'] == 123456
+    assert row['due_date'] == pd.Timestamp('2024-04-08T06:59Z')
+    assert row['hard_due_date'] == pd.Timestamp('2024-04-11T06:59Z')
+    assert row['created_at'] == pd.Timestamp('2024-04-01T07:00Z')
+    assert row['total_points'] == 100.0
+
+
+def test_created_at_before_new_year_takes_previous_year():
+    df = assignments_to_dataframe([make_assignment(1, 'Dec 20', '2025-01-02T00:00', '2025-01-10T23:59')], tz='UTC')
+    assert df.loc[0, 'created_at'] == pd.Timestamp('2024-12-20T00:00Z')